@@ -7,9 +7,35 @@ import instaloader
 import os
 import sys
 import argparse
+import asyncio
+import json
 import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Try to import aiohttp/aiofiles for the asyncio download path (optional;
+# falls back to a thread pool)
+try:
+    import aiofiles
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Try to import Pillow for --recompress-quality (optional; pillow-simd is a faster drop-in)
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(
@@ -18,11 +44,104 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Image bytes come from Instagram's CDN, which is not subject to the GraphQL
+# rate limit, so these can be fetched concurrently
+DOWNLOAD_CONCURRENCY = 8
+CONNECTION_LIMIT = 64
+
+# Response bodies are streamed to disk in chunks of this size, so memory per
+# in-flight download stays flat regardless of image size
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Per-directory sidecar holding ETag / Last-Modified validators for conditional GETs
+HTTP_CACHE_FILE = ".http_cache.json"
+
+# Shortcode of a post, reel or IGTV URL, e.g. https://www.instagram.com/p/SHORTCODE/
+_SHORTCODE_RE = re.compile(r'/(?:p|reel|tv)/([A-Za-z0-9_-]+)')
+
+# Cache directory shared across runs
+CACHE_DIR = Path.home() / ".cache" / "instagram_downloader"
+RATE_STATE_FILE = CACHE_DIR / "rate_state.json"
+
+# How long a cached profile lookup is reused before querying Instagram again
+PROFILE_CACHE_TTL = 60 * 60
+
+# Pinned posts are listed first regardless of their date, so --fast-update only
+# stops at an old post once it is past these slots
+PINNED_POST_SLOTS = 3
+
+
+class PersistentRateController(instaloader.RateController):
+    """
+    Rate controller whose query history survives across runs
+    
+    instaloader only tracks requests made by the current process, so a script
+    invoked repeatedly starts every run with an empty sliding window and can hit
+    429s right away. This controller saves the recent query timestamps to disk
+    and restores them on the next run.
+    """
+    
+    def __init__(self, context: instaloader.InstaloaderContext, requests_per_window: Optional[int] = None):
+        """
+        Initialize the rate controller
+        
+        Args:
+            context: Instaloader context
+            requests_per_window: Requests allowed per query type in instaloader's
+                11-minute sliding window (None for instaloader's defaults)
+        """
+        super().__init__(context)
+        self.requests_per_window = requests_per_window
+    
+    def count_per_sliding_window(self, query_type: str) -> int:
+        if self.requests_per_window is not None:
+            return self.requests_per_window
+        return super().count_per_sliding_window(query_type)
+    
+    def load_state(self, path: Path) -> None:
+        """Restore query timestamps saved by a previous run"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable rate state {path}: {e}")
+            return
+        
+        # Timestamps are stored as wall-clock time, since time.monotonic()
+        # values are not comparable across processes
+        offset = time.monotonic() - time.time()
+        for query_type, timestamps in saved.items():
+            self._query_timestamps.setdefault(query_type, []).extend(t + offset for t in timestamps)
+    
+    def save_state(self, path: Path) -> None:
+        """Save query timestamps from the last hour for the next run"""
+        offset = time.time() - time.monotonic()
+        cutoff = time.monotonic() - 60 * 60
+        state = {
+            query_type: [t + offset for t in timestamps if t > cutoff]
+            for query_type, timestamps in self._query_timestamps.items()
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError as e:
+            logger.warning(f"Could not write rate state {path}: {e}")
+
 
 class InstagramDownloader:
     """Downloads images from Instagram profiles"""
     
-    def __init__(self, download_dir: str = "downloads", username: Optional[str] = None, password: Optional[str] = None):
+    def __init__(
+        self,
+        download_dir: str = "downloads",
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        requests_per_window: Optional[int] = None,
+        recompress_quality: Optional[int] = None
+    ):
         """
         Initialize the Instagram downloader
         
@@ -30,10 +149,27 @@ class InstagramDownloader:
             download_dir: Directory to save downloaded images
             username: Instagram username for authentication (optional, but recommended)
             password: Instagram password (optional, but recommended)
+            requests_per_window: Requests allowed per query type in an 11-minute
+                window (None for instaloader's defaults)
+            recompress_quality: Re-save downloaded images as JPEG at this quality
+                (1-95) to save disk space (None to keep the original files)
         """
+        if recompress_quality is not None and not PIL_AVAILABLE:
+            raise ValueError("Recompressing images requires Pillow. Install it with: pip install pillow")
+        self.recompress_quality = recompress_quality
+        
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True)
         
+        # Pooled keep-alive session for CDN image GETs, so TLS handshakes are
+        # reused across the whole profile (urllib3 pools are thread-safe)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=CONNECTION_LIMIT,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        ))
+        
         # Initialize Instaloader
         self.loader = instaloader.Instaloader(
             download_videos=False,  # Only download images
@@ -43,8 +179,10 @@ class InstagramDownloader:
             save_metadata=False,  # Set to True if you want JSON metadata
             compress_json=False,
             post_metadata_txt_pattern='',
-            max_connection_attempts=3
+            max_connection_attempts=3,
+            rate_controller=lambda context: PersistentRateController(context, requests_per_window)
         )
+        self.loader.context._rate_controller.load_state(RATE_STATE_FILE)
         
         # Try to login if credentials provided
         if username and password:
@@ -52,6 +190,8 @@ class InstagramDownloader:
                 logger.info(f"Attempting to login as {username}...")
                 self.loader.login(username, password)
                 logger.info("Login successful!")
+                # Save the session so later runs can reuse it without logging in again
+                self.loader.save_session_to_file()
             except Exception as e:
                 logger.warning(f"Login failed: {e}")
                 logger.warning("Continuing without login (may have limited access)")
@@ -63,20 +203,392 @@ class InstagramDownloader:
             except FileNotFoundError:
                 logger.info("No saved session found. Continuing without authentication.")
     
-    def download_profile(self, profile_username: str, max_posts: Optional[int] = None) -> int:
+    def _save_rate_state(self) -> None:
+        """Persist the rate controller's query history for the next run"""
+        self.loader.context._rate_controller.save_state(RATE_STATE_FILE)
+    
+    @staticmethod
+    def _conditional_headers(path: Path, http_cache: dict) -> dict:
+        """Build If-None-Match / If-Modified-Since headers for an already downloaded image"""
+        headers = {}
+        cached = http_cache.get(path.stem) if path.exists() else None
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+    
+    @staticmethod
+    def _validators(headers) -> dict:
+        """Pick the ETag / Last-Modified validators out of a 200 response's headers"""
+        return {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified")
+        }
+    
+    @staticmethod
+    def _part_path(path: Path) -> Path:
+        """Temporary file an image is streamed into before being moved into place"""
+        return path.with_name(path.name + ".part")
+    
+    @classmethod
+    def _discard_download(cls, path: Path, http_cache: dict) -> None:
+        """
+        Clean up after a failed download
+        
+        Removes the partial file and forgets the image's validators, so the next
+        run fetches it in full instead of trusting a 304.
+        
+        Args:
+            path: Destination file path
+            http_cache: Validators by filename
+        """
+        http_cache.pop(path.stem, None)
+        try:
+            os.remove(cls._part_path(path))
+        except FileNotFoundError:
+            pass
+    
+    def _finish_image(self, path: Path, mtime: datetime) -> None:
+        """
+        Post-process a freshly downloaded image
+        
+        Recompresses it if requested and sets the post timestamp as the file's
+        modification time.
+        
+        Args:
+            path: Downloaded image file
+            mtime: Post timestamp
+        """
+        if self.recompress_quality is not None:
+            tmp_path = path.with_name(path.name + ".tmp")
+            with Image.open(path) as img:
+                img.convert("RGB").save(
+                    tmp_path, "JPEG",
+                    quality=self.recompress_quality, optimize=True, progressive=True
+                )
+            os.replace(tmp_path, path)
+        os.utime(path, (datetime.now().timestamp(), mtime.timestamp()))
+    
+    async def _download_image(
+        self,
+        session: "aiohttp.ClientSession",
+        sem: asyncio.Semaphore,
+        url: str,
+        path: Path,
+        mtime: datetime,
+        http_cache: dict
+    ) -> bool:
+        """
+        Download a single image to disk
+        
+        Args:
+            session: Shared aiohttp session
+            sem: Semaphore bounding the number of in-flight requests
+            url: Image URL
+            path: Destination file path
+            mtime: Post timestamp to set as the file's modification time
+            http_cache: Validators by filename; updated in place once an image is saved
+            
+        Returns:
+            True if successful (or unchanged), False otherwise
+        """
+        headers = self._conditional_headers(path, http_cache)
+        part_path = self._part_path(path)
+        
+        try:
+            async with sem, session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info(f"Unchanged: {path.name}")
+                    return True
+                response.raise_for_status()
+                validators = self._validators(response.headers)
+                async with aiofiles.open(part_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+            # Recompression is CPU-bound, so keep it off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._finish_image, part_path, mtime)
+            os.replace(part_path, path)
+            http_cache[path.stem] = validators
+            logger.info(f"Downloaded: {path.name}")
+            return True
+        except Exception as e:
+            self._discard_download(path, http_cache)
+            logger.error(f"Error downloading {path.name}: {e}")
+            return False
+    
+    async def _fan_out(self, jobs: List[Tuple[str, str, datetime]], out_dir: Path) -> int:
+        """
+        Download images concurrently
+        
+        Args:
+            jobs: List of (filename, url, mtime) tuples
+            out_dir: Directory to save the images in
+            
+        Returns:
+            Number of images that failed to download
+        """
+        http_cache = self._load_http_cache(out_dir)
+        sem = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT, limit_per_host=DOWNLOAD_CONCURRENCY)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(*[
+                self._download_image(session, sem, url, out_dir / f"{filename}.jpg", mtime, http_cache)
+                for filename, url, mtime in jobs
+            ])
+        self._save_http_cache(out_dir, http_cache)
+        return results.count(False)
+    
+    def _download_to(
+        self,
+        out_dir: Path,
+        filename: str,
+        url: str,
+        mtime: datetime,
+        http_cache: dict
+    ) -> bool:
+        """
+        Download a single image into a directory without changing the working directory
+        
+        Args:
+            out_dir: Directory to save the image in
+            filename: File name without extension
+            url: Image URL
+            mtime: Post timestamp to set as the file's modification time
+            http_cache: Validators by filename; updated in place once an image is saved
+            
+        Returns:
+            True if successful (or unchanged), False otherwise
+        """
+        path = out_dir / f"{filename}.jpg"
+        headers = self._conditional_headers(path, http_cache)
+        part_path = self._part_path(path)
+        
+        try:
+            with self._session.get(url, headers=headers, stream=True, timeout=30) as response:
+                if response.status_code == 304:
+                    logger.info(f"Unchanged: {path.name}")
+                    return True
+                response.raise_for_status()
+                validators = self._validators(response.headers)
+                with open(part_path, 'wb', buffering=0) as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                    # The images are written once and not read back, so flush them
+                    # and tell the kernel to drop them from the page cache
+                    os.fsync(f.fileno())
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            self._finish_image(part_path, mtime)
+            os.replace(part_path, path)
+            http_cache[path.stem] = validators
+            logger.info(f"Downloaded: {path.name}")
+            return True
+        except Exception as e:
+            self._discard_download(path, http_cache)
+            logger.error(f"Error downloading {path.name}: {e}")
+            return False
+    
+    def _download_threaded(self, jobs: List[Tuple[str, str, datetime]], out_dir: Path) -> int:
+        """
+        Download images concurrently on a thread pool
+        
+        Args:
+            jobs: List of (filename, url, mtime) tuples
+            out_dir: Directory to save the images in
+            
+        Returns:
+            Number of images that failed to download
+        """
+        http_cache = self._load_http_cache(out_dir)
+        failed = 0
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY) as executor:
+            futures = [
+                executor.submit(self._download_to, out_dir, filename, url, mtime, http_cache)
+                for filename, url, mtime in jobs
+            ]
+            for future in as_completed(futures):
+                if not future.result():
+                    failed += 1
+        self._save_http_cache(out_dir, http_cache)
+        return failed
+    
+    def _download_jobs(self, jobs: List[Tuple[str, str, datetime]], out_dir: Path) -> int:
+        """
+        Download images concurrently, using asyncio when aiohttp is installed
+        
+        Args:
+            jobs: List of (filename, url, mtime) tuples
+            out_dir: Directory to save the images in
+            
+        Returns:
+            Number of images that failed to download
+        """
+        if AIOHTTP_AVAILABLE:
+            return asyncio.run(self._fan_out(jobs, out_dir))
+        return self._download_threaded(jobs, out_dir)
+    
+    @staticmethod
+    def _load_http_cache(out_dir: Path) -> dict:
+        """Load the conditional-GET validators saved by a previous run"""
+        cache_path = out_dir / HTTP_CACHE_FILE
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable HTTP cache {cache_path}: {e}")
+            return {}
+    
+    @staticmethod
+    def _save_http_cache(out_dir: Path, http_cache: dict) -> None:
+        """Persist the conditional-GET validators for the next run"""
+        cache_path = out_dir / HTTP_CACHE_FILE
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(http_cache, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache {cache_path}: {e}")
+    
+    @staticmethod
+    def _image_jobs(
+        post: instaloader.Post,
+        typename: str,
+        shortcode: str,
+        mtime: datetime
+    ) -> List[Tuple[str, str, datetime]]:
+        """
+        Collect the images of a post as download jobs
+        
+        The caller passes in the attributes it has already read, so each lazily
+        resolved post attribute is touched at most once.
+        
+        Args:
+            post: Instagram post
+            typename: post.typename
+            shortcode: post.shortcode
+            mtime: post.date_local
+            
+        Returns:
+            List of (filename, url, mtime) tuples; empty for video-only posts
+        """
+        if typename == 'GraphImage':
+            return [(shortcode, post.url, mtime)]
+        if typename != 'GraphSidecar':
+            return []
+        
+        # Read the carousel children straight from the post listing's node data.
+        # get_sidecar_nodes() fetches the full post metadata whenever a child is a
+        # video (to get its video_url), which we never need since videos are
+        # skipped. Relies on instaloader's private Post._node (pinned to 4.x).
+        # Logged-in sessions still use get_sidecar_nodes() for its higher
+        # quality image URLs.
+        context = post._context
+        edges = None
+        if not (context.iphone_support and context.is_logged_in):
+            edges = post._node.get("edge_sidecar_to_children", {}).get("edges")
+        if edges is not None:
+            nodes = [edge["node"] for edge in edges]
+            return [
+                (f"{shortcode}_{idx}", node["display_url"], mtime)
+                for idx, node in enumerate(nodes)
+                if not node.get("is_video")
+            ]
+        
+        # Materialize the carousel nodes once and keep the original indices
+        # so filenames stay stable across runs
+        nodes = list(post.get_sidecar_nodes())
+        return [
+            (f"{shortcode}_{idx}", node.display_url, mtime)
+            for idx, node in enumerate(nodes)
+            if not node.is_video
+        ]
+    
+    def _get_profile_cached(self, username: str) -> Tuple[instaloader.Profile, dict]:
+        """
+        Look up a profile, reusing a lookup from the last hour if there is one
+        
+        The profile lookup is a rate-limited request, so repeated runs read the
+        profile node from ~/.cache/instagram_downloader/<username>.json instead.
+        
+        Args:
+            username: Instagram username (without @)
+            
+        Returns:
+            Tuple of the profile and the cache entry (which also holds the
+            timestamp of the newest post seen on previous runs)
+        """
+        cache_path = CACHE_DIR / f"{username.lower()}.json"
+        entry = {}
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable profile cache {cache_path}: {e}")
+        
+        if entry.get("node") and time.time() - entry.get("fetched_at", 0) < PROFILE_CACHE_TTL:
+            logger.info(f"Using cached profile lookup for {username}")
+            # Relies on instaloader internals: a Profile built from a complete node
+            # is marked as such so get_posts() doesn't look it up again. The node's
+            # post listing is an empty page that says more follow, so get_posts()
+            # fetches the current first page instead of serving cached posts
+            node = dict(entry["node"])
+            media = node.get("edge_owner_to_timeline_media") or {}
+            node["edge_owner_to_timeline_media"] = {
+                "count": media.get("count"),
+                "edges": [],
+                "page_info": {"has_next_page": True, "end_cursor": None}
+            }
+            profile = instaloader.Profile(self.loader.context, node)
+            profile._has_full_metadata = True
+            return profile, entry
+        
+        profile = instaloader.Profile.from_username(self.loader.context, username)
+        # Only the profile metadata is cached; the first page of posts would be
+        # stale on the next run
+        node = dict(profile._node)
+        media = node.get("edge_owner_to_timeline_media") or {}
+        node["edge_owner_to_timeline_media"] = {"count": media.get("count")}
+        entry["node"] = node
+        entry["fetched_at"] = time.time()
+        self._save_profile_cache(username, entry)
+        return profile, entry
+    
+    @staticmethod
+    def _save_profile_cache(username: str, entry: dict) -> None:
+        """Write a profile cache entry"""
+        cache_path = CACHE_DIR / f"{username.lower()}.json"
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write profile cache {cache_path}: {e}")
+    
+    def download_profile(
+        self,
+        profile_username: str,
+        max_posts: Optional[int] = None,
+        fast_update: bool = False
+    ) -> int:
         """
         Download all images from an Instagram profile
         
         Args:
             profile_username: Instagram username (without @)
             max_posts: Maximum number of posts to download (None for all)
+            fast_update: Stop at the first post that was already seen on a previous run
             
         Returns:
             Number of posts downloaded
         """
         try:
             logger.info(f"Fetching profile: {profile_username}")
-            profile = instaloader.Profile.from_username(self.loader.context, profile_username)
+            profile, cache_entry = self._get_profile_cached(profile_username)
             
             logger.info(f"Profile found: {profile.full_name or profile_username}")
             logger.info(f"Total posts: {profile.mediacount}")
@@ -85,52 +597,63 @@ class InstagramDownloader:
             profile_dir = self.download_dir / profile_username
             profile_dir.mkdir(exist_ok=True)
             
-            # Change to profile directory for downloads
-            original_dir = os.getcwd()
-            os.chdir(profile_dir)
+            downloaded_count = 0
+            posts_to_download = max_posts if max_posts else profile.mediacount
             
-            try:
-                downloaded_count = 0
-                posts_to_download = max_posts if max_posts else profile.mediacount
-                
-                logger.info(f"Starting download of up to {posts_to_download} posts...")
+            logger.info(f"Starting download of up to {posts_to_download} posts...")
+            
+            # Metadata is paginated serially (this is what instaloader rate limits);
+            # the image URLs are collected and fetched concurrently afterwards
+            jobs: List[Tuple[str, str, datetime]] = []
+            last_newest = cache_entry.get("newest_post") if fast_update else None
+            newest = cache_entry.get("newest_post", 0)
+            
+            for index, post in enumerate(profile.get_posts()):
+                # The post date comes with the post listing, so this costs no requests
+                post_time = post.date_utc.timestamp()
+                newest = max(newest, post_time)
+                if last_newest is not None and post_time <= last_newest:
+                    if index < PINNED_POST_SLOTS:
+                        continue
+                    logger.info("Reached posts from a previous run, stopping (--fast-update)")
+                    break
                 
-                for post in profile.get_posts():
-                    if max_posts and downloaded_count >= max_posts:
-                        break
+                shortcode = None
+                try:
+                    # Read each post attribute once; any of them may trigger a request
+                    typename = post.typename
+                    # Video posts never yield images; typename comes with the post
+                    # listing, so this skip costs no extra requests
+                    if typename not in ('GraphImage', 'GraphSidecar'):
+                        continue
+                    shortcode = post.shortcode
                     
-                    try:
-                        # Only download if it's a single image (not a carousel)
-                        if post.typename == 'GraphImage':
-                            self.loader.download_pic(
-                                filename=post.shortcode,
-                                url=post.url,
-                                mtime=post.date_local
-                            )
-                            downloaded_count += 1
-                            logger.info(f"Downloaded [{downloaded_count}/{posts_to_download}]: {post.shortcode}")
-                        elif post.typename == 'GraphSidecar':
-                            # For carousel posts, download all images
-                            for idx, node in enumerate(post.get_sidecar_nodes()):
-                                if node.is_video:
-                                    continue  # Skip videos
-                                self.loader.download_pic(
-                                    filename=f"{post.shortcode}_{idx}",
-                                    url=node.display_url,
-                                    mtime=post.date_local
-                                )
-                            downloaded_count += 1
-                            logger.info(f"Downloaded carousel [{downloaded_count}/{posts_to_download}]: {post.shortcode} ({post.typename})")
-                        
-                    except Exception as e:
-                        logger.error(f"Error downloading post {post.shortcode}: {e}")
+                    post_jobs = self._image_jobs(post, typename, shortcode, post.date_local)
+                    if not post_jobs:
                         continue
+                    jobs.extend(post_jobs)
+                    downloaded_count += 1
+                    logger.info(f"Queued [{downloaded_count}/{posts_to_download}]: {shortcode} ({len(post_jobs)} images)")
+                    
+                except Exception as e:
+                    logger.error(f"Error reading post {shortcode or '<unknown>'}: {e}")
+                    continue
                 
-                logger.info(f"Download complete! Downloaded {downloaded_count} posts.")
-                return downloaded_count
-                
-            finally:
-                os.chdir(original_dir)
+                # Stop as soon as the cap is reached: asking the iterator for one
+                # more post could make it fetch another page of 12 posts
+                if max_posts and downloaded_count >= max_posts:
+                    break
+            
+            logger.info(f"Downloading {len(jobs)} images...")
+            failed = self._download_jobs(jobs, profile_dir)
+            if failed:
+                logger.warning(f"{failed} images failed to download")
+            else:
+                cache_entry["newest_post"] = newest
+                self._save_profile_cache(profile_username, cache_entry)
+            
+            logger.info(f"Download complete! Downloaded {downloaded_count} posts.")
+            return downloaded_count
                 
         except instaloader.exceptions.ProfileNotExistsException:
             logger.error(f"Profile '{profile_username}' does not exist or is private.")
@@ -142,6 +665,8 @@ class InstagramDownloader:
         except Exception as e:
             logger.error(f"Error downloading profile: {e}")
             return 0
+        finally:
+            self._save_rate_state()
     
     def download_single_post(self, post_url: str) -> bool:
         """
@@ -154,9 +679,12 @@ class InstagramDownloader:
             True if successful, False otherwise
         """
         try:
-            # Extract shortcode from URL
-            # URL format: https://www.instagram.com/p/SHORTCODE/
-            shortcode = post_url.split('/p/')[-1].rstrip('/')
+            # Validate the URL before spending a rate-limited request on it
+            match = _SHORTCODE_RE.search(post_url)
+            if not match:
+                logger.error(f"Not an Instagram post URL: {post_url}")
+                return False
+            shortcode = match.group(1)
             
             logger.info(f"Downloading post: {shortcode}")
             post = instaloader.Post.from_shortcode(self.loader.context, shortcode)
@@ -165,35 +693,22 @@ class InstagramDownloader:
             post_dir = self.download_dir / "single_posts"
             post_dir.mkdir(exist_ok=True)
             
-            original_dir = os.getcwd()
-            os.chdir(post_dir)
+            jobs = self._image_jobs(post, post.typename, shortcode, post.date_local)
+            http_cache = self._load_http_cache(post_dir)
+            results = [
+                self._download_to(post_dir, filename, url, mtime, http_cache)
+                for filename, url, mtime in jobs
+            ]
+            self._save_http_cache(post_dir, http_cache)
             
-            try:
-                if post.typename == 'GraphImage':
-                    self.loader.download_pic(
-                        filename=post.shortcode,
-                        url=post.url,
-                        mtime=post.date_local
-                    )
-                    logger.info(f"Downloaded: {post.shortcode}")
-                elif post.typename == 'GraphSidecar':
-                    for idx, node in enumerate(post.get_sidecar_nodes()):
-                        if node.is_video:
-                            continue
-                        self.loader.download_pic(
-                            filename=f"{post.shortcode}_{idx}",
-                            url=node.display_url,
-                            mtime=post.date_local
-                        )
-                    logger.info(f"Downloaded carousel: {post.shortcode}")
-                
-                return True
-            finally:
-                os.chdir(original_dir)
+            logger.info(f"Downloaded {results.count(True)}/{len(jobs)} images from post: {shortcode}")
+            return all(results)
                 
         except Exception as e:
             logger.error(f"Error downloading post: {e}")
             return False
+        finally:
+            self._save_rate_state()
 
 
 def main():
@@ -228,18 +743,28 @@ Examples:
                        help='Directory to save downloaded images (default: downloads)')
     parser.add_argument('--max-posts', type=int, default=10,
                        help='Maximum number of posts to download (default: 10)')
+    parser.add_argument('--recompress-quality', type=int, choices=range(1, 96), metavar='N',
+                       help='Re-save images as JPEG at quality N (1-95) to save disk space (requires Pillow)')
+    parser.add_argument('--fast-update', action='store_true',
+                       help='Stop at the first post that was already downloaded on a previous run')
+    parser.add_argument('--requests-per-window', type=int,
+                       help="Instagram requests allowed per query type in an 11-minute window (default: instaloader's limits)")
     
     args = parser.parse_args()
     
     # Validate arguments
     if not args.post_url and not args.profile:
         parser.error("Either provide a profile username or use --post-url")
+    if args.recompress_quality is not None and not PIL_AVAILABLE:
+        parser.error("--recompress-quality requires Pillow. Install it with: pip install pillow")
     
     # Initialize downloader
     downloader = InstagramDownloader(
         download_dir=args.output_dir,
         username=args.username,
-        password=args.password
+        password=args.password,
+        requests_per_window=args.requests_per_window,
+        recompress_quality=args.recompress_quality
     )
     
     # Download
@@ -252,7 +777,11 @@ Examples:
             print("\n✗ Failed to download post")
             sys.exit(1)
     else:
-        count = downloader.download_profile(args.profile, max_posts=args.max_posts)
+        count = downloader.download_profile(
+            args.profile,
+            max_posts=args.max_posts,
+            fast_update=args.fast_update
+        )
         if count > 0:
             print(f"\n✓ Successfully downloaded {count} posts from @{args.profile}")
             print(f"✓ Saved to: {args.output_dir}/{args.profile}/")
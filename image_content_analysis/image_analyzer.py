@@ -4,14 +4,37 @@ Analyzes images and answers questions about their content using OpenAI's vision
 """
 
 import os
+import asyncio
 import base64
+import io
+import mmap
+import json
 import argparse
+import functools
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
-import requests
-from openai import OpenAI
+from typing import Dict, List, Optional, Union
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from openai import APIError, RateLimitError, APIConnectionError, AuthenticationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+# HTTP/2 lets concurrent requests share one TLS connection (optional, needs the h2 package)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Pillow is used to downscale large local images before upload (optional)
+try:
+    from PIL import Image, ImageOps, UnidentifiedImageError
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(
@@ -20,6 +43,153 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Encoded data URLs keyed by (resolved path, mtime_ns, size, max side), so asking several
+# questions about the same local image only reads and encodes it once. Bounded by
+# the total size of the cached URLs and guarded by a lock, since analyze_many
+# encodes on executor threads
+_ENCODE_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_ENCODE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_encode_cache_bytes = 0
+_encode_cache_lock = threading.Lock()
+
+# MIME types for local image suffixes; anything else is sent as JPEG rather than
+# an empty "data:image/;base64," type that the API rejects
+_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+}
+
+# The API scales images down to these sizes anyway, so larger local images are
+# resized before upload instead of sending pixels that are thrown away
+MAX_IMAGE_SIDE = {"low": 768, "high": 2048, "auto": 2048}
+DOWNSCALE_JPEG_QUALITY = 85
+
+# Raw bytes base64-encoded per step when building a data URL (a multiple of 3,
+# so the chunks concatenate without padding)
+_BASE64_CHUNK = 3 * 64 * 1024
+
+# Default number of concurrent requests for analyze_many
+DEFAULT_CONCURRENCY = 8
+
+# Connection pool limits for the OpenAI HTTP clients
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=16)
+HTTP_TIMEOUT = 60.0
+
+
+# Transient connection failures are retried with exponential backoff before
+# being reported to the user (the only retry layer: the clients use max_retries=0)
+_retry_connection_errors = retry(
+    retry=retry_if_exception_type(APIConnectionError),
+    wait=wait_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+
+
+def _cached_data_url(key: tuple) -> Optional[str]:
+    """Return a cached data URL and mark it as recently used, or None"""
+    with _encode_cache_lock:
+        data_url = _ENCODE_CACHE.get(key)
+        if data_url is not None:
+            _ENCODE_CACHE.move_to_end(key)
+        return data_url
+
+
+def _cache_data_url(key: tuple, data_url: str) -> None:
+    """Cache a data URL, evicting the least recently used ones to stay under the byte cap"""
+    global _encode_cache_bytes
+    # Data URLs are ASCII, so their length is their size in bytes
+    size = len(data_url)
+    if size > _ENCODE_CACHE_MAX_BYTES:
+        return
+    with _encode_cache_lock:
+        previous = _ENCODE_CACHE.pop(key, None)
+        if previous is not None:
+            _encode_cache_bytes -= len(previous)
+        _ENCODE_CACHE[key] = data_url
+        _encode_cache_bytes += size
+        while _encode_cache_bytes > _ENCODE_CACHE_MAX_BYTES:
+            _, evicted = _ENCODE_CACHE.popitem(last=False)
+            _encode_cache_bytes -= len(evicted)
+
+
+def _friendly_error(e: Exception) -> Optional[str]:
+    """
+    Build a user-friendly message for an OpenAI API error
+    
+    Args:
+        e: Exception raised by the OpenAI client
+        
+    Returns:
+        Error message, or None if the exception is not an OpenAI API error
+    """
+    if isinstance(e, RateLimitError):
+        return (
+            "API quota exceeded. You have exceeded your current OpenAI API quota.\n"
+            "Please check your plan and billing details at: https://platform.openai.com/account/billing\n"
+            f"Error details: {str(e)}"
+        )
+    if isinstance(e, AuthenticationError):
+        return (
+            "Authentication failed. Please check your OpenAI API key.\n"
+            "Make sure it's set correctly in the OPENAI_API_KEY environment variable or --api-key argument.\n"
+            f"Error details: {str(e)}"
+        )
+    if isinstance(e, APIConnectionError):
+        return (
+            "Failed to connect to OpenAI API. Please check your internet connection.\n"
+            f"Error details: {str(e)}"
+        )
+    if isinstance(e, APIError):
+        return f"OpenAI API error: {str(e)}"
+    return None
+
+
+def _openai_friendly_errors(action: str):
+    """
+    Decorator that retries connection errors and turns OpenAI API errors into
+    RuntimeErrors with user-friendly messages
+    
+    Works for both regular and async methods.
+    
+    Args:
+        action: Description of the operation for log messages, e.g. "analyzing image"
+    """
+    def decorator(fn):
+        def handle(e: Exception) -> None:
+            error_msg = _friendly_error(e)
+            if error_msg is None:
+                logger.error(f"Error {action}: {str(e)}")
+                return
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+        
+        retrying_fn = _retry_connection_errors(fn)
+        
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await retrying_fn(*args, **kwargs)
+                except Exception as e:
+                    handle(e)
+                    raise
+            return async_wrapper
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return retrying_fn(*args, **kwargs)
+            except Exception as e:
+                handle(e)
+                raise
+        return wrapper
+    return decorator
+
 
 class ImageAnalyzer:
     """Analyzes image content using GPT-4o vision API"""
@@ -38,59 +208,160 @@ class ImageAnalyzer:
                 "Provide it as an argument or set OPENAI_API_KEY environment variable."
             )
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = OpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=httpx.Client(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
         self.model = "gpt-4o"  # GPT-4o with vision capabilities
     
-    def _encode_image(self, image_path: str) -> str:
+    def _async_client(self) -> AsyncOpenAI:
+        """
+        Create an async OpenAI client with its own connection pool
+        
+        Pooled connections are bound to the event loop they were opened on, so a
+        client is created per event loop (use it with ``async with``) rather than
+        kept on the instance and reused across asyncio.run() calls.
+        """
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+    
+    def _encode_image(self, image_path: str, mime_type: str) -> str:
         """
-        Encode image file to base64 string
+        Encode image file to a base64 data URL
         
         Args:
             image_path: Path to the image file
+            mime_type: MIME type to put in the data URL
             
         Returns:
-            Base64 encoded string of the image
+            Data URL of the image
         """
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            if os.fstat(image_file.fileno()).st_size == 0:
+                return self._data_url(mime_type, b"")
+            # Encode straight from the mapped file instead of reading a copy first
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._data_url(mime_type, mm)
+    
+    @staticmethod
+    def _data_url(mime_type: str, data) -> str:
+        """
+        Build a base64 data URL from raw image bytes (bytes or an mmap)
+        
+        The payload is encoded in chunks into one preallocated bytearray after the
+        prefix and decoded once, so the only full-size copies of the (potentially
+        multi-MB) base64 payload are that buffer and the returned str.
+        """
+        prefix = b"data:" + mime_type.encode("ascii") + b";base64,"
+        url = bytearray(len(prefix) + 4 * -(-len(data) // 3))
+        url[:len(prefix)] = prefix
+        view = memoryview(url)
+        pos = len(prefix)
+        for start in range(0, len(data), _BASE64_CHUNK):
+            encoded = base64.b64encode(data[start:start + _BASE64_CHUNK])
+            view[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+        view.release()
+        return url.decode("ascii")
     
-    def _get_image_data(self, image_source: str) -> dict:
+    def _downscale_image(self, image_path: str, max_side: int) -> Optional[bytes]:
+        """
+        Downscale an image that is larger than the API will process
+        
+        Args:
+            image_path: Path to the image file
+            max_side: Maximum width/height in pixels
+            
+        Returns:
+            JPEG bytes of the resized image, or None if the image is small enough,
+            can't be read by Pillow (or Pillow is not installed) and should be sent as-is
+        """
+        if not PIL_AVAILABLE:
+            return None
+        
+        try:
+            with Image.open(image_path) as img:
+                # The longest side doesn't change under rotation, so the check can
+                # run before the (decoding) EXIF transpose below
+                if max(img.size) <= max_side:
+                    return None
+                # The re-encoded JPEG carries no EXIF, so apply the Orientation tag to
+                # the pixels first or phone photos are uploaded sideways
+                img = ImageOps.exif_transpose(img)
+                img.thumbnail((max_side, max_side), Image.LANCZOS)
+                if img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info:
+                    # JPEG has no alpha, so flatten onto white instead of letting
+                    # transparent areas turn into whatever colour is under them
+                    rgba = img.convert("RGBA")
+                    img = Image.new("RGB", rgba.size, (255, 255, 255))
+                    img.paste(rgba, mask=rgba.getchannel("A"))
+                buffer = io.BytesIO()
+                img.convert("RGB").save(buffer, format="JPEG", quality=DOWNSCALE_JPEG_QUALITY)
+                return buffer.getvalue()
+        except (UnidentifiedImageError, OSError) as e:
+            logger.warning(f"Could not downscale {image_path}, sending it as-is: {e}")
+            return None
+    
+    def _get_image_data(self, image_source: str, detail: str = "auto") -> dict:
         """
         Get image data in the format required by OpenAI API
         
         Args:
             image_source: Path to local image file or URL to image
+            detail: Image detail level ("low", "high" or "auto")
             
         Returns:
             Dictionary with image data for API request
         """
-        # Check if it's a URL
+        # Remote images are passed through as-is: OpenAI fetches them itself, so
+        # they are never downloaded and re-uploaded as base64 here
         if image_source.startswith(('http://', 'https://')):
             return {
                 "type": "image_url",
-                "image_url": {"url": image_source}
+                "image_url": {"url": image_source, "detail": detail}
             }
         
+        if image_source.startswith('file://'):
+            raise ValueError(f"Use a plain file path instead of a file:// URL: {image_source}")
+        
         # Otherwise, treat as local file path
         image_path = Path(image_source)
         if not image_path.exists():
             raise FileNotFoundError(f"Image file not found: {image_source}")
         
-        # Encode local image to base64
-        base64_image = self._encode_image(str(image_path))
+        max_side = MAX_IMAGE_SIDE[detail]
+        stat = image_path.stat()
+        key = (str(image_path.resolve()), stat.st_mtime_ns, stat.st_size, max_side)
+        data_url = _cached_data_url(key)
+        if data_url is None:
+            resized = self._downscale_image(str(image_path), max_side)
+            if resized is not None:
+                data_url = self._data_url("image/jpeg", resized)
+            else:
+                # Encode local image to base64
+                mime_type = _MIME_TYPES.get(image_path.suffix.lower(), "image/jpeg")
+                data_url = self._encode_image(str(image_path), mime_type)
+            _cache_data_url(key, data_url)
         
         return {
             "type": "image_url",
             "image_url": {
-                "url": f"data:image/{image_path.suffix[1:]};base64,{base64_image}"
+                "url": data_url,
+                "detail": detail
             }
         }
     
+    @_openai_friendly_errors("analyzing image")
     def analyze_image(
         self,
         image_source: str,
         prompt: str = "Describe this image in detail. Include all important elements, objects, people, text, colors, and any other notable features.",
-        max_tokens: int = 300
+        max_tokens: int = 300,
+        detail: str = "auto"
     ) -> str:
         """
         Analyze an image and get a description
@@ -99,69 +370,132 @@ class ImageAnalyzer:
             image_source: Path to local image file or URL to image
             prompt: Custom prompt for image analysis
             max_tokens: Maximum number of tokens in the response
+            detail: Image detail level ("low", "high" or "auto"); "low" is
+                faster and cheaper but sees less of the image
             
         Returns:
             Analysis result as a string
         """
-        try:
-            logger.info(f"Analyzing image: {image_source}")
-            
-            image_data = self._get_image_data(image_source)
+        logger.info(f"Analyzing image: {image_source}")
+        
+        image_data = self._get_image_data(image_source, detail)
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        image_data
+                    ]
+                }
+            ],
+            max_tokens=max_tokens
+        )
+        
+        result = response.choices[0].message.content
+        logger.info("Analysis completed successfully")
+        return result
+    
+    @_openai_friendly_errors("analyzing image")
+    async def analyze_image_async(
+        self,
+        image_source: str,
+        prompt: str = "Describe this image in detail. Include all important elements, objects, people, text, colors, and any other notable features.",
+        max_tokens: int = 300,
+        detail: str = "auto",
+        aclient: Optional[AsyncOpenAI] = None
+    ) -> str:
+        """
+        Analyze an image and get a description without blocking the event loop
+        
+        Args:
+            image_source: Path to local image file or URL to image
+            prompt: Custom prompt for image analysis
+            max_tokens: Maximum number of tokens in the response
+            detail: Image detail level ("low", "high" or "auto"); "low" is
+                faster and cheaper but sees less of the image
+            aclient: Async client to send the request with, created on the running
+                event loop (see _async_client); a temporary one is used if omitted
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": prompt},
-                            image_data
-                        ]
-                    }
-                ],
-                max_tokens=max_tokens
-            )
+        Returns:
+            Analysis result as a string
+        """
+        logger.info(f"Analyzing image: {image_source}")
+        
+        # Reading and encoding a local file is blocking, so do it on a worker thread
+        loop = asyncio.get_running_loop()
+        image_data = await loop.run_in_executor(None, self._get_image_data, image_source, detail)
+        
+        request = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        image_data
+                    ]
+                }
+            ],
+            "max_tokens": max_tokens
+        }
+        if aclient is not None:
+            response = await aclient.chat.completions.create(**request)
+        else:
+            async with self._async_client() as aclient:
+                response = await aclient.chat.completions.create(**request)
+        
+        result = response.choices[0].message.content
+        logger.info(f"Analysis completed successfully: {image_source}")
+        return result
+    
+    def analyze_many(
+        self,
+        image_sources: List[str],
+        prompt: str = "Describe this image in detail. Include all important elements, objects, people, text, colors, and any other notable features.",
+        max_tokens: int = 300,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        detail: str = "auto"
+    ) -> List[Union[str, Exception]]:
+        """
+        Analyze several images concurrently
+        
+        Args:
+            image_sources: Paths to local image files or URLs to images
+            prompt: Custom prompt for image analysis
+            max_tokens: Maximum number of tokens in each response
+            concurrency: Maximum number of requests in flight at once
+            detail: Image detail level ("low", "high" or "auto")
             
-            result = response.choices[0].message.content
-            logger.info("Analysis completed successfully")
-            return result
+        Returns:
+            One entry per image, in order: the analysis result, or the exception
+            raised for that image
+        """
+        async def run() -> List[Union[str, Exception]]:
+            sem = asyncio.Semaphore(concurrency)
             
-        except RateLimitError as e:
-            error_msg = (
-                "API quota exceeded. You have exceeded your current OpenAI API quota.\n"
-                "Please check your plan and billing details at: https://platform.openai.com/account/billing\n"
-                f"Error details: {str(e)}"
-            )
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except AuthenticationError as e:
-            error_msg = (
-                "Authentication failed. Please check your OpenAI API key.\n"
-                "Make sure it's set correctly in the OPENAI_API_KEY environment variable or --api-key argument.\n"
-                f"Error details: {str(e)}"
-            )
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except APIConnectionError as e:
-            error_msg = (
-                "Failed to connect to OpenAI API. Please check your internet connection.\n"
-                f"Error details: {str(e)}"
-            )
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except APIError as e:
-            error_msg = f"OpenAI API error: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except Exception as e:
-            logger.error(f"Error analyzing image: {str(e)}")
-            raise
+            # One pooled client per call, opened and closed on this event loop
+            async with self._async_client() as aclient:
+                async def analyze(image_source: str) -> str:
+                    async with sem:
+                        return await self.analyze_image_async(image_source, prompt, max_tokens, detail, aclient)
+                
+                return await asyncio.gather(
+                    *[analyze(image_source) for image_source in image_sources],
+                    return_exceptions=True
+                )
+        
+        return asyncio.run(run())
     
+    @_openai_friendly_errors("answering question")
     def ask_question(
         self,
         image_source: str,
         question: str,
-        max_tokens: int = 300
+        max_tokens: int = 300,
+        detail: str = "auto"
     ) -> str:
         """
         Ask a specific question about an image
@@ -170,64 +504,161 @@ class ImageAnalyzer:
             image_source: Path to local image file or URL to image
             question: Question to ask about the image
             max_tokens: Maximum number of tokens in the response
+            detail: Image detail level ("low", "high" or "auto"); "low" is
+                faster and cheaper but sees less of the image
             
         Returns:
             Answer to the question
         """
-        try:
-            logger.info(f"Answering question about image: {image_source}")
-            logger.info(f"Question: {question}")
-            
-            image_data = self._get_image_data(image_source)
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": question},
-                            image_data
-                        ]
-                    }
-                ],
-                max_tokens=max_tokens
-            )
-            
-            result = response.choices[0].message.content
-            logger.info("Question answered successfully")
-            return result
+        logger.info(f"Answering question about image: {image_source}")
+        logger.info(f"Question: {question}")
+        
+        image_data = self._get_image_data(image_source, detail)
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": question},
+                        image_data
+                    ]
+                }
+            ],
+            max_tokens=max_tokens
+        )
+        
+        result = response.choices[0].message.content
+        logger.info("Question answered successfully")
+        return result
+
+    
+    @_openai_friendly_errors("answering questions")
+    def ask_questions(
+        self,
+        image_source: str,
+        questions: List[str],
+        max_tokens: int = 300,
+        detail: str = "auto"
+    ) -> List[str]:
+        """
+        Ask several questions about an image in a single request
+        
+        The image is sent once and all questions are answered together, instead
+        of uploading the image again for every question.
+        
+        Args:
+            image_source: Path to local image file or URL to image
+            questions: Questions to ask about the image
+            max_tokens: Maximum number of tokens per answer
+            detail: Image detail level ("low", "high" or "auto")
             
-        except RateLimitError as e:
-            error_msg = (
-                "API quota exceeded. You have exceeded your current OpenAI API quota.\n"
-                "Please check your plan and billing details at: https://platform.openai.com/account/billing\n"
-                f"Error details: {str(e)}"
-            )
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except AuthenticationError as e:
-            error_msg = (
-                "Authentication failed. Please check your OpenAI API key.\n"
-                "Make sure it's set correctly in the OPENAI_API_KEY environment variable or --api-key argument.\n"
-                f"Error details: {str(e)}"
-            )
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except APIConnectionError as e:
-            error_msg = (
-                "Failed to connect to OpenAI API. Please check your internet connection.\n"
-                f"Error details: {str(e)}"
+        Returns:
+            Answers in the same order as the questions
+        """
+        logger.info(f"Answering {len(questions)} questions about image: {image_source}")
+        
+        image_data = self._get_image_data(image_source, detail)
+        
+        numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(questions, 1))
+        prompt = (
+            "Answer each numbered question about this image. "
+            'Respond with a JSON object of the form {"answers": ["...", "..."]}, '
+            "with exactly one answer string per question, in order.\n\n"
+            f"{numbered}"
+        )
+        
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": prompt},
+                        image_data
+                    ]
+                }
+            ],
+            max_tokens=max_tokens * len(questions),
+            response_format={"type": "json_object"}
+        )
+        
+        answers = json.loads(response.choices[0].message.content).get("answers", [])
+        if not isinstance(answers, list) or len(answers) != len(questions):
+            raise ValueError(
+                f"Expected {len(questions)} answers, got: {response.choices[0].message.content}"
             )
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except APIError as e:
-            error_msg = f"OpenAI API error: {str(e)}"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except Exception as e:
-            logger.error(f"Error answering question: {str(e)}")
-            raise
+        logger.info("Questions answered successfully")
+        return [str(answer) for answer in answers]
+
+
+
+# Per-process state for analyze_batch workers
+_worker_analyzer: Optional[ImageAnalyzer] = None
+_worker_options: dict = {}
+
+
+def _init_worker(api_key: Optional[str], prompt: str, max_tokens: int, detail: str) -> None:
+    """Create the ImageAnalyzer for a worker process (clients can't be pickled)"""
+    global _worker_analyzer, _worker_options, _ENCODE_CACHE_MAX_BYTES
+    # Each image is analyzed once per batch, so cached data URLs would never be hit
+    _ENCODE_CACHE_MAX_BYTES = 0
+    _worker_analyzer = ImageAnalyzer(api_key=api_key)
+    _worker_options = {"prompt": prompt, "max_tokens": max_tokens, "detail": detail}
+
+
+def _worker_analyze(image_source: str) -> Dict[str, Optional[str]]:
+    """Analyze one image in a worker process"""
+    try:
+        result = _worker_analyzer.analyze_image(image_source, **_worker_options)
+        return {"image": image_source, "result": result, "error": None}
+    except Exception as e:
+        return {"image": image_source, "result": None, "error": str(e)}
+
+
+def analyze_batch(
+    image_sources: List[str],
+    output_path: str,
+    workers: int = 4,
+    api_key: Optional[str] = None,
+    prompt: str = "Describe this image in detail. Include all important elements, objects, people, text, colors, and any other notable features.",
+    max_tokens: int = 300,
+    detail: str = "auto"
+) -> int:
+    """
+    Analyze a large batch of images on a pool of worker processes
+    
+    Each worker has its own OpenAI client, so reading, resizing and base64/JSON
+    encoding the images runs in parallel across CPU cores. Results are written by
+    this process as JSON Lines, one {"image", "result", "error"} object per image,
+    in input order.
+    
+    Args:
+        image_sources: Paths to local image files or URLs to images
+        output_path: JSON Lines file to write the results to
+        workers: Number of worker processes
+        api_key: OpenAI API key. If not provided, will try to get from OPENAI_API_KEY env var
+        prompt: Custom prompt for image analysis
+        max_tokens: Maximum number of tokens in each response
+        detail: Image detail level ("low", "high" or "auto")
+        
+    Returns:
+        Number of images that failed
+    """
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(api_key, prompt, max_tokens, detail)
+    ) as executor, open(output_path, "w", encoding="utf-8") as out:
+        for record in executor.map(_worker_analyze, image_sources, chunksize=4):
+            if record["error"] is not None:
+                failed += 1
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+    logger.info(f"Analyzed {len(image_sources) - failed}/{len(image_sources)} images, results in {output_path}")
+    return failed
 
 
 def main():
@@ -238,6 +669,7 @@ def main():
     parser.add_argument(
         "image",
         type=str,
+        nargs="?",
         help="Path to local image file or URL to image"
     )
     parser.add_argument(
@@ -249,7 +681,8 @@ def main():
         "--question",
         "-q",
         type=str,
-        help="Ask a specific question about the image"
+        action="append",
+        help="Ask a specific question about the image (repeat to ask several in one request)"
     )
     parser.add_argument(
         "--prompt",
@@ -264,22 +697,81 @@ def main():
         default=300,
         help="Maximum number of tokens in response (default: 300)"
     )
+    parser.add_argument(
+        "--detail",
+        choices=["low", "high", "auto"],
+        default="auto",
+        help="Image detail level; 'low' is faster and cheaper (default: auto)"
+    )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        help="Analyze every image listed in this file (one path or URL per line) instead of a single image"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of worker processes for --batch (default: 4)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default="results.jsonl",
+        help="JSON Lines file for --batch results (default: results.jsonl)"
+    )
     
     args = parser.parse_args()
     
+    if not args.image and not args.batch:
+        parser.error("Either provide an image or use --batch")
+    
     try:
+        if args.batch:
+            with open(args.batch, "r", encoding="utf-8") as f:
+                image_sources = [line.strip() for line in f if line.strip()]
+            failed = analyze_batch(
+                image_sources,
+                output_path=args.output,
+                workers=args.workers,
+                api_key=args.api_key,
+                prompt=args.prompt,
+                max_tokens=args.max_tokens,
+                detail=args.detail
+            )
+            print(f"\n✓ Analyzed {len(image_sources) - failed}/{len(image_sources)} images")
+            print(f"✓ Results saved to: {args.output}")
+            return 1 if failed else 0
+        
         analyzer = ImageAnalyzer(api_key=args.api_key)
         
-        if args.question:
+        if args.question and len(args.question) > 1:
+            # Answer several questions with a single request
+            answers = analyzer.ask_questions(
+                image_source=args.image,
+                questions=args.question,
+                max_tokens=args.max_tokens,
+                detail=args.detail
+            )
+            for question, answer in zip(args.question, answers):
+                print("\n" + "="*60)
+                print("QUESTION:")
+                print(question)
+                print("\n" + "="*60)
+                print("ANSWER:")
+                print(answer)
+        elif args.question:
             # Answer a specific question
             result = analyzer.ask_question(
                 image_source=args.image,
-                question=args.question,
-                max_tokens=args.max_tokens
+                question=args.question[0],
+                max_tokens=args.max_tokens,
+                detail=args.detail
             )
             print("\n" + "="*60)
             print("QUESTION:")
-            print(args.question)
+            print(args.question[0])
             print("\n" + "="*60)
             print("ANSWER:")
             print(result)
@@ -288,7 +780,8 @@ def main():
             result = analyzer.analyze_image(
                 image_source=args.image,
                 prompt=args.prompt,
-                max_tokens=args.max_tokens
+                max_tokens=args.max_tokens,
+                detail=args.detail
             )
             print("\n" + "="*60)
             print("IMAGE ANALYSIS:")
@@ -6,8 +6,12 @@ to achieve the highest possible ranking (S rank).
 Game URL: https://yage.ai/genai/pi.html
 """
 
-import time
 import math
+import json
+import os
+import socket
+import threading
+from functools import lru_cache
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
@@ -15,6 +19,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException
 
 # Try to import webdriver-manager for automatic ChromeDriver management
 try:
@@ -30,22 +35,286 @@ try:
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
 
+# Try to import NumPy for vectorized circle point generation (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Files remembering the ChromeDriver path and the kept-alive browser between runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pi_circle_automation")
+CHROMEDRIVER_PATH_FILE = os.path.join(CACHE_DIR, "chromedriver_path")
+DEBUG_PORT_FILE = os.path.join(CACHE_DIR, "debug_port")
+
+
+@lru_cache(maxsize=None)
+def _chromedriver_path():
+    """
+    Return the ChromeDriver path from webdriver-manager.
+    
+    The path is cached on disk, so later runs skip webdriver-manager's network
+    version check as long as the driver binary is still there; _create_driver
+    drops it if the browser rejects the driver.
+    """
+    try:
+        with open(CHROMEDRIVER_PATH_FILE) as f:
+            path = f.read().strip()
+        if os.path.isfile(path):
+            return path
+    except OSError:
+        pass
+    
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(CHROMEDRIVER_PATH_FILE, "w") as f:
+            f.write(path)
+    except OSError:
+        pass
+    return path
+
+
+def _forget_chromedriver_path():
+    """
+    Drop the cached ChromeDriver path, e.g. after Chrome auto-updated past it.
+    
+    Returns True if a path was cached on disk.
+    """
+    _chromedriver_path.cache_clear()
+    try:
+        os.remove(CHROMEDRIVER_PATH_FILE)
+        return True
+    except OSError:
+        return False
+
+
+def _read_debug_port():
+    """Return the debugging port of a kept-alive browser that is still running, or None."""
+    try:
+        with open(DEBUG_PORT_FILE) as f:
+            port = int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return port
+    except OSError:
+        return None
+
+
+def _free_port():
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Drawing helpers installed once per page load by _inject_helpers(), so each draw
+# only sends its numeric arguments instead of a freshly formatted script
+_HELPERS_SCRIPT = """
+window.__piCircle = {
+    // Dispatch mousedown, mousemove events along the circle, mouseup and click
+    triggerEvents: function(canvas, centerX, centerY, radius, numPoints) {
+        var rect = canvas.getBoundingClientRect();
+        var startX = rect.left + centerX + radius;
+        var startY = rect.top + centerY;
+        var init = {bubbles: true, cancelable: true, clientX: startX, clientY: startY, button: 0};
+        canvas.dispatchEvent(new MouseEvent('mousedown', init));
+        
+        // One event object re-initialized per point instead of a new MouseEvent each time
+        var moveEvent = document.createEvent('MouseEvent');
+        for (var i = 1; i <= numPoints; i++) {
+            var angle = (2 * Math.PI * i) / numPoints;
+            var x = rect.left + centerX + radius * Math.cos(angle);
+            var y = rect.top + centerY + radius * Math.sin(angle);
+            moveEvent.initMouseEvent('mousemove', true, true, window, 0,
+                                     x, y, x, y,
+                                     false, false, false, false, 0, null);
+            canvas.dispatchEvent(moveEvent);
+        }
+        
+        canvas.dispatchEvent(new MouseEvent('mouseup', init));
+        // Also trigger click event which some games use
+        canvas.dispatchEvent(new MouseEvent('click', init));
+    },
+    
+    // Stroke a circle on the canvas, then dispatch the mouse events for the game
+    draw: function(canvas, centerX, centerY, radius, numPoints, eventPoints) {
+        var ctx = canvas.getContext('2d');
+        ctx.strokeStyle = '#000000';
+        ctx.lineWidth = 2;
+        ctx.lineCap = 'round';
+        ctx.lineJoin = 'round';
+        
+        ctx.beginPath();
+        for (var i = 0; i <= numPoints; i++) {
+            var angle = (2 * Math.PI * i) / numPoints;
+            var x = centerX + radius * Math.cos(angle);
+            var y = centerY + radius * Math.sin(angle);
+            if (i === 0) {
+                ctx.moveTo(x, y);
+            } else {
+                ctx.lineTo(x, y);
+            }
+        }
+        ctx.closePath();
+        ctx.stroke();
+        
+        this.triggerEvents(canvas, centerX, centerY, radius, eventPoints);
+    }
+};
+"""
+
+# Finds the result label in one round-trip: checks likely result elements first and
+# only falls back to scanning text nodes if none of them mention a rank or score
+_RESULT_SCRIPT = """
+var pattern = /Rank|Score/;
+var candidates = document.querySelectorAll(
+    '#result, #rank, #score, .result, .rank, .score, ' +
+    '[id*="result"], [id*="rank"], [id*="score"], ' +
+    '[class*="result"], [class*="rank"], [class*="score"]'
+);
+var texts = [];
+for (var i = 0; i < candidates.length; i++) {
+    var text = candidates[i].textContent.trim();
+    if (pattern.test(text)) {
+        texts.push(text);
+    }
+}
+if (texts.length) {
+    return texts;
+}
+var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+while (walker.nextNode()) {
+    if (pattern.test(walker.currentNode.nodeValue)) {
+        texts.push(walker.currentNode.parentNode.textContent.trim());
+    }
+}
+return texts;
+"""
+
+
+@lru_cache(maxsize=16)
+def _unit_circle(num_points):
+    """
+    Return num_points + 1 (cos, sin) pairs evenly spaced around the unit circle,
+    the last one equal to the first so the circle closes.
+    
+    The table is built once per point count, so repeated draws with the same
+    num_points make no trig calls. Quadrant symmetry is used when num_points is
+    a multiple of 4, so only the first quarter is actually computed.
+    """
+    if num_points % 4 == 0:
+        quarter = num_points // 4
+        if NUMPY_AVAILABLE:
+            angles = np.arange(quarter) * (2 * np.pi / num_points)
+            first = list(zip(np.cos(angles).tolist(), np.sin(angles).tolist()))
+        else:
+            step = 2 * math.pi / num_points
+            first = [(math.cos(i * step), math.sin(i * step)) for i in range(quarter)]
+        # Rotating by 90 degrees maps (c, s) to (-s, c)
+        second = [(-sin_a, cos_a) for cos_a, sin_a in first]
+        third = [(-cos_a, -sin_a) for cos_a, sin_a in first]
+        fourth = [(sin_a, -cos_a) for cos_a, sin_a in first]
+        table = first + second + third + fourth
+    elif NUMPY_AVAILABLE:
+        angles = np.arange(num_points) * (2 * np.pi / num_points)
+        table = list(zip(np.cos(angles).tolist(), np.sin(angles).tolist()))
+    else:
+        step = 2 * math.pi / num_points
+        table = [(math.cos(i * step), math.sin(i * step)) for i in range(num_points)]
+    table.append(table[0])
+    return tuple(table)
+
+
+def _circle_points(center_x, center_y, radius, num_points):
+    """
+    Calculate num_points + 1 evenly spaced points on a circle (the last point
+    closes the circle) by scaling the cached unit-circle table.
+    """
+    return [(center_x + radius * cos_a, center_y + radius * sin_a)
+            for cos_a, sin_a in _unit_circle(num_points)]
+
+
+@lru_cache(maxsize=16)
+def _circle_deltas(radius, num_points):
+    """
+    Return the whole-pixel (dx, dy) steps that trace a circle of the given radius
+    from its rightmost point, for relative pointer moves.
+    
+    Steps are taken between rounded positions, so they sum back to the start
+    exactly instead of accumulating rounding drift. Independent of the center.
+    """
+    rounded = [(round(radius * cos_a), round(radius * sin_a))
+               for cos_a, sin_a in _unit_circle(num_points)]
+    return tuple((x1 - x0, y1 - y0)
+                 for (x0, y0), (x1, y1) in zip(rounded, rounded[1:]))
+
 
 class PiCircleAutomation:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, keep_alive=False, fast=False):
         """
         Initialize the automation with Chrome WebDriver.
         
+        The browser is started on a background thread right away, so its startup
+        overlaps with whatever the caller does before open_game().
+        
         Args:
             headless: If True, run browser in headless mode (faster but you won't see it)
+            keep_alive: If True, leave the browser running on close() and reuse it
+                on the next run instead of starting a new one
+            fast: If True, return from page loads at DOMContentLoaded and skip
+                images, extensions and background networking
         """
         self.driver = None
         self.headless = headless
+        self.keep_alive = keep_alive
+        self.fast = fast
         self.game_url = "https://yage.ai/genai/pi.html"
-        
+        self._enter_pressed = threading.Event()
+        self._enter_thread = None
+        self._canvas_cache = None
+        self._driver_thread = threading.Thread(target=self.setup_driver, daemon=True)
+        self._driver_thread.start()
+        
+    def _create_driver(self, chrome_options):
+        """Start ChromeDriver with the given options."""
+        # Use webdriver-manager if available for automatic ChromeDriver management
+        if WEBDRIVER_MANAGER_AVAILABLE:
+            try:
+                return webdriver.Chrome(service=Service(_chromedriver_path()), options=chrome_options)
+            except SessionNotCreatedException:
+                # A cached driver no longer matches the browser once Chrome updates;
+                # let webdriver-manager fetch a matching one and try once more
+                if not _forget_chromedriver_path():
+                    raise
+                return webdriver.Chrome(service=Service(_chromedriver_path()), options=chrome_options)
+        return webdriver.Chrome(options=chrome_options)
+    
     def setup_driver(self):
         """Set up Chrome WebDriver with appropriate options."""
+        if self.keep_alive:
+            port = _read_debug_port()
+            if port is not None:
+                # Attach to the browser left running by a previous run
+                attach_options = Options()
+                attach_options.debugger_address = f"127.0.0.1:{port}"
+                try:
+                    self.driver = self._create_driver(attach_options)
+                    print(f"Reusing browser on debugging port {port}")
+                    return True
+                except Exception as e:
+                    print(f"Could not reuse running browser, starting a new one: {e}")
+        
         chrome_options = Options()
+        if self.keep_alive:
+            # Keep the browser running after this process exits and expose a port
+            # for the next run to attach to
+            port = _free_port()
+            chrome_options.add_argument(f"--remote-debugging-port={port}")
+            chrome_options.add_experimental_option("detach", True)
         if self.headless:
             chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -53,14 +322,20 @@ class PiCircleAutomation:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        if self.fast:
+            # Don't wait for subresources; open_game() waits for the canvas itself
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
         
         try:
-            # Use webdriver-manager if available for automatic ChromeDriver management
-            if WEBDRIVER_MANAGER_AVAILABLE:
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver = self._create_driver(chrome_options)
+            
+            if self.keep_alive:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(DEBUG_PORT_FILE, "w") as f:
+                    f.write(str(port))
             
             # Hide webdriver property
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -74,19 +349,24 @@ class PiCircleAutomation:
     
     def open_game(self):
         """Navigate to the Pi Day Challenge game."""
+        # Wait for the browser started in __init__
+        if self._driver_thread is not None:
+            self._driver_thread.join()
+            self._driver_thread = None
         if not self.driver:
             if not self.setup_driver():
                 return False
         
         print(f"Opening game: {self.game_url}")
         self.driver.get(self.game_url)
-        time.sleep(2)  # Wait for page to load
+        self._canvas_cache = None
         
         # Wait for the canvas or drawing area to be available
         try:
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "canvas"))
             )
+            self._inject_helpers()
             print("Game loaded successfully!")
             return True
         except Exception as e:
@@ -95,37 +375,45 @@ class PiCircleAutomation:
             try:
                 canvas = self.driver.find_element(By.TAG_NAME, "canvas")
                 if canvas:
+                    self._inject_helpers()
                     print("Canvas found!")
                     return True
             except:
                 pass
             return False
     
+    def _inject_helpers(self):
+        """Install the JavaScript drawing helpers (window.__piCircle) on the current page."""
+        self.driver.execute_script(_HELPERS_SCRIPT)
+    
     def get_canvas_info(self):
         """
         Get canvas element and its dimensions.
         Returns canvas element and its size, or None if not found.
+        The result is cached, so only the first call queries the page.
         """
+        if self._canvas_cache is not None:
+            return self._canvas_cache
+        
         try:
             canvas = self.driver.find_element(By.TAG_NAME, "canvas")
-            canvas_size = canvas.size
-            canvas_location = canvas.location
             
-            # Get actual canvas dimensions from JavaScript
-            canvas_width = self.driver.execute_script(
-                "return arguments[0].width;", canvas
-            )
-            canvas_height = self.driver.execute_script(
-                "return arguments[0].height;", canvas
+            # Get actual canvas dimensions and page location in one round-trip
+            canvas_width, canvas_height, canvas_location = self.driver.execute_script(
+                "var c = arguments[0], r = c.getBoundingClientRect();"
+                "return [c.width, c.height, {x: r.left + window.scrollX, y: r.top + window.scrollY}];",
+                canvas
             )
             
             print(f"Canvas found: {canvas_width}x{canvas_height}")
-            return canvas, canvas_width, canvas_height, canvas_location
+            self._canvas_cache = (canvas, canvas_width, canvas_height, canvas_location)
+            return self._canvas_cache
         except Exception as e:
             print(f"Error finding canvas: {e}")
             return None, None, None, None
     
-    def draw_circle_with_js(self, center_x=None, center_y=None, radius=None, num_points=200):
+    def draw_circle_with_js(self, center_x=None, center_y=None, radius=None, num_points=120,
+                            event_points=24):
         """
         Draw a perfect circle directly on the canvas using JavaScript.
         This is the most precise method.
@@ -134,7 +422,9 @@ class PiCircleAutomation:
             center_x: X coordinate of circle center (None = use canvas center)
             center_y: Y coordinate of circle center (None = use canvas center)
             radius: Circle radius (None = use 40% of canvas width)
-            num_points: Number of points to draw (more = smoother but slower)
+            num_points: Number of points in the drawn path (only affects the line geometry)
+            event_points: Number of mousemove events dispatched along the circle for
+                the game to register the drawing
         """
         canvas, canvas_width, canvas_height, canvas_location = self.get_canvas_info()
         
@@ -150,214 +440,21 @@ class PiCircleAutomation:
         if radius is None:
             radius = min(canvas_width, canvas_height) * 0.35  # 35% of smaller dimension
         
-        print(f"Drawing circle: center=({center_x:.1f}, {center_y:.1f}), radius={radius:.1f}, points={num_points}")
-        
-        # JavaScript code to draw a perfect circle on canvas
-        draw_script = f"""
-        var canvas = arguments[0];
-        var ctx = canvas.getContext('2d');
-        
-        // Clear canvas first (optional - comment out if you want to keep existing drawings)
-        // ctx.clearRect(0, 0, canvas.width, canvas.height);
-        
-        var centerX = {center_x};
-        var centerY = {center_y};
-        var radius = {radius};
-        var numPoints = {num_points};
-        
-        // Set drawing style
-        ctx.strokeStyle = '#000000';
-        ctx.lineWidth = 2;
-        ctx.lineCap = 'round';
-        ctx.lineJoin = 'round';
-        
-        // Begin drawing path
-        ctx.beginPath();
-        
-        // Draw circle using parametric equations
-        for (var i = 0; i <= numPoints; i++) {{
-            var angle = (2 * Math.PI * i) / numPoints;
-            var x = centerX + radius * Math.cos(angle);
-            var y = centerY + radius * Math.sin(angle);
-            
-            if (i === 0) {{
-                ctx.moveTo(x, y);
-            }} else {{
-                ctx.lineTo(x, y);
-            }}
-        }}
-        
-        // Close the path and stroke
-        ctx.closePath();
-        ctx.stroke();
-        
-        // Trigger any necessary events (mousemove, mouseup, etc.) that the game might listen to
-        var event = new Event('mousemove', {{ bubbles: true }});
-        canvas.dispatchEvent(event);
-        """
+        print(f"Drawing circle: center=({center_x:.1f}, {center_y:.1f}), radius={radius:.1f}, points={num_points}, events={event_points}")
         
         try:
-            self.driver.execute_script(draw_script, canvas)
-            print("Circle drawn successfully!")
-            time.sleep(0.5)  # Brief wait
-            
-            # Trigger mouse events via JavaScript to make the game recognize the drawing
-            # This is fast and doesn't redraw since we're just dispatching events
-            if not self.trigger_mouse_events_js(canvas, center_x, center_y, radius, num_points=20):
-                # Fallback: if JS events don't work, try fast mouse simulation
-                print("Trying fast mouse simulation as fallback...")
-                self.quick_mouse_simulation(canvas, center_x, center_y, radius, num_points=30)
-            
+            # Draw and dispatch the mouse events in one call to the injected helper
+            self.driver.execute_script(
+                "window.__piCircle.draw(arguments[0], arguments[1], arguments[2], "
+                "arguments[3], arguments[4], arguments[5]);",
+                canvas, center_x, center_y, radius, num_points, event_points
+            )
+            print("Circle drawn and mouse events triggered!")
             return True
         except Exception as e:
             print(f"Error drawing circle: {e}")
             return False
     
-    def trigger_mouse_events_js(self, canvas, center_x, center_y, radius, num_points=20):
-        """
-        Trigger mouse events via JavaScript to make the game recognize the drawing.
-        This is fast and doesn't redraw - just dispatches events.
-        """
-        try:
-            # JavaScript to dispatch mouse events along the circle path
-            trigger_events_script = f"""
-            var canvas = arguments[0];
-            var centerX = {center_x};
-            var centerY = {center_y};
-            var radius = {radius};
-            var numPoints = {num_points};
-            
-            // Get bounding rect for accurate coordinate calculation
-            var rect = canvas.getBoundingClientRect();
-            
-            // Trigger mousedown at start point
-            var startX = centerX + radius;
-            var startY = centerY;
-            var mouseDownEvent = new MouseEvent('mousedown', {{
-                bubbles: true,
-                cancelable: true,
-                clientX: rect.left + startX,
-                clientY: rect.top + startY,
-                button: 0
-            }});
-            canvas.dispatchEvent(mouseDownEvent);
-            
-            // Trigger mousemove events along the circle path (minimal points for speed)
-            for (var i = 1; i <= numPoints; i++) {{
-                var angle = (2 * Math.PI * i) / numPoints;
-                var x = centerX + radius * Math.cos(angle);
-                var y = centerY + radius * Math.sin(angle);
-                
-                var mouseMoveEvent = new MouseEvent('mousemove', {{
-                    bubbles: true,
-                    cancelable: true,
-                    clientX: rect.left + x,
-                    clientY: rect.top + y,
-                    button: 0
-                }});
-                canvas.dispatchEvent(mouseMoveEvent);
-            }}
-            
-            // Trigger mouseup at end point (same as start for a complete circle)
-            var mouseUpEvent = new MouseEvent('mouseup', {{
-                bubbles: true,
-                cancelable: true,
-                clientX: rect.left + startX,
-                clientY: rect.top + startY,
-                button: 0
-            }});
-            canvas.dispatchEvent(mouseUpEvent);
-            
-            // Also trigger click event which some games use
-            var clickEvent = new MouseEvent('click', {{
-                bubbles: true,
-                cancelable: true,
-                clientX: rect.left + startX,
-                clientY: rect.top + startY,
-                button: 0
-            }});
-            canvas.dispatchEvent(clickEvent);
-            """
-            
-            self.driver.execute_script(trigger_events_script, canvas)
-            print("Mouse events triggered (fast)")
-            time.sleep(0.3)
-            return True
-        except Exception as e:
-            print(f"Error triggering mouse events: {e}")
-            return False
-    
-    def quick_mouse_simulation(self, canvas, center_x, center_y, radius, num_points=30):
-        """
-        Quick mouse simulation - traces the circle very fast for game recognition.
-        Uses minimal points and no delays for speed.
-        """
-        try:
-            # Calculate circle points
-            points = []
-            for i in range(num_points + 1):
-                angle = 2 * math.pi * i / num_points
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                points.append((x, y))
-            
-            # Get canvas location for accurate positioning
-            canvas_location = canvas.location
-            
-            # Convert points to JavaScript array format
-            points_js = "[" + ", ".join([f"[{x}, {y}]" for x, y in points]) + "]"
-            
-            # Use JavaScript to dispatch mouse events quickly
-            # This simulates mouse movement but doesn't actually draw since circle is already drawn
-            trace_script = f"""
-            var canvas = arguments[0];
-            var points = {points_js};
-            var rect = canvas.getBoundingClientRect();
-            
-            // Trigger mousedown at start
-            var mouseDown = new MouseEvent('mousedown', {{
-                bubbles: true,
-                cancelable: true,
-                clientX: rect.left + points[0][0],
-                clientY: rect.top + points[0][1],
-                button: 0,
-                buttons: 1
-            }});
-            canvas.dispatchEvent(mouseDown);
-            
-            // Rapidly trigger mousemove events
-            for (var i = 1; i < points.length; i++) {{
-                var mouseMove = new MouseEvent('mousemove', {{
-                    bubbles: true,
-                    cancelable: true,
-                    clientX: rect.left + points[i][0],
-                    clientY: rect.top + points[i][1],
-                    button: 0,
-                    buttons: 1
-                }});
-                canvas.dispatchEvent(mouseMove);
-            }}
-            
-            // Trigger mouseup at end
-            var mouseUp = new MouseEvent('mouseup', {{
-                bubbles: true,
-                cancelable: true,
-                clientX: rect.left + points[0][0],
-                clientY: rect.top + points[0][1],
-                button: 0,
-                buttons: 0
-            }});
-            canvas.dispatchEvent(mouseUp);
-            """
-            
-            self.driver.execute_script(trace_script, canvas)
-            print("Fast mouse simulation completed")
-            time.sleep(0.2)
-            return True
-        except Exception as e:
-            print(f"Error in quick mouse simulation: {e}")
-            return False
-    
     def simulate_mouse_events_on_canvas(self, canvas, center_x, center_y, radius, num_points=50):
         """
         Simulate mouse events on the canvas to trigger game recognition.
@@ -365,45 +462,30 @@ class PiCircleAutomation:
         NOTE: This method actually draws with mouse, which may draw a second circle.
         """
         try:
-            actions = ActionChains(self.driver)
+            # W3C pointer moves default to 250 ms each; move instantly instead
+            actions = ActionChains(self.driver, duration=0)
             
             # Move to canvas first
             actions.move_to_element(canvas)
             actions.perform()
-            time.sleep(0.5)
-            
-            # Calculate circle points
-            points = []
-            for i in range(num_points + 1):
-                angle = 2 * math.pi * i / num_points
-                x = center_x + radius * math.cos(angle)
-                y = center_y + radius * math.sin(angle)
-                points.append((x, y))
-            
-            # Move to starting point
-            start_x = points[0][0]
-            start_y = points[0][1]
             
-            # Convert canvas coordinates to screen coordinates
-            canvas_location = canvas.location
-            screen_x = canvas_location['x'] + start_x
-            screen_y = canvas_location['y'] + start_y
-            
-            actions.move_to_element_with_offset(canvas, start_x - canvas.size['width']/2, 
-                                               start_y - canvas.size['height']/2)
+            # Move to the starting point (rightmost point of the circle); the offset
+            # is relative to the canvas center
+            canvas_size = canvas.size
+            actions.move_to_element_with_offset(
+                canvas,
+                round(center_x + radius - canvas_size['width'] / 2),
+                round(center_y - canvas_size['height'] / 2)
+            )
             actions.click_and_hold()
             
-            # Draw circle by moving through points
-            for x, y in points[1:]:
-                offset_x = x - canvas.size['width']/2
-                offset_y = y - canvas.size['height']/2
-                actions.move_to_element_with_offset(canvas, offset_x, offset_y)
-                time.sleep(0.01)  # Small delay for smoothness
+            # Draw circle by stepping through the precomputed relative moves
+            for dx, dy in _circle_deltas(radius, num_points):
+                actions.move_by_offset(dx, dy)
             
             actions.release()
             actions.perform()
             
-            
             print("Mouse events simulated")
         except Exception as e:
             print(f"Error simulating mouse events: {e}")
@@ -433,18 +515,12 @@ class PiCircleAutomation:
         
         # Scroll canvas into view
         self.driver.execute_script("arguments[0].scrollIntoView(true);", canvas)
-        time.sleep(0.5)
         
         # Calculate circle points (these are canvas coordinates, 0,0 at top-left)
-        points = []
-        for i in range(num_points + 1):
-            angle = 2 * math.pi * i / num_points
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            points.append((x, y))
+        points = _circle_points(center_x, center_y, radius, num_points)
         
         # Convert points to JavaScript array format
-        points_js = "[" + ", ".join([f"[{x}, {y}]" for x, y in points]) + "]"
+        points_js = json.dumps(points)
         
         # Use JavaScript to dispatch mouse events along the circle path
         # This method is NOT affected by your real mouse cursor position
@@ -452,6 +528,7 @@ class PiCircleAutomation:
         var canvas = arguments[0];
         var points = {points_js};
         var rect = canvas.getBoundingClientRect();
+        window.__drawComplete = false;
         
         // Trigger mousedown at start point
         var startX = points[0][0];
@@ -498,6 +575,7 @@ class PiCircleAutomation:
                         buttons: 0
                     }});
                     canvas.dispatchEvent(mouseUpEvent);
+                    window.__drawComplete = true;
                 }}
             }}
         }}
@@ -510,32 +588,63 @@ class PiCircleAutomation:
             # Execute the script - this will dispatch mouse events asynchronously
             self.driver.execute_script(mouse_draw_script, canvas)
             
-            # Wait for all events to be dispatched (num_points * 5ms + buffer)
-            total_time = (num_points * 5) / 1000.0 + 0.5
+            # Wait until the script flags the last event as dispatched (~num_points * 5ms)
+            total_time = (num_points * 5) / 1000.0
             print(f"Drawing circle with mouse events (this will take ~{total_time:.1f} seconds)...")
-            time.sleep(total_time)
+            WebDriverWait(self.driver, total_time + 5, poll_frequency=0.05).until(
+                lambda d: d.execute_script("return window.__drawComplete === true")
+            )
             
             print("Circle drawn with mouse event simulation!")
-            time.sleep(0.5)
             return True
         except Exception as e:
             print(f"Error drawing with mouse events: {e}")
             return False
     
     def wait_for_result(self, timeout=10):
-        """Wait for the game to calculate and display the result."""
+        """
+        Wait for the game to calculate and display the result.
+        
+        Returns:
+            List of result texts found on the page (empty if none appeared)
+        """
         print("Waiting for game to process...")
-        time.sleep(timeout)
+        results = []
         
-        # Try to find and display the result
+        # Return as soon as a result is shown instead of always waiting the full timeout
         try:
-            # Look for common result indicators (adjust selectors based on actual game)
-            result_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'S') or contains(text(), 'Rank') or contains(text(), 'Score')]")
-            if result_elements:
-                for elem in result_elements:
-                    print(f"Found result: {elem.text}")
+            results = WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script(_RESULT_SCRIPT)
+            )
+            for text in results:
+                print(f"Found result: {text}")
+        except TimeoutException:
+            print(f"No result found within {timeout} seconds")
         except:
             pass
+        return results
+    
+    def _read_enter(self):
+        """Block on stdin until Enter is pressed (runs on a background thread)."""
+        try:
+            input()
+        except EOFError:
+            pass
+        self._enter_pressed.set()
+    
+    def _wait_for_enter(self, timeout=None):
+        """
+        Wait until the user presses Enter, or until timeout seconds have passed.
+        
+        Returns:
+            True if Enter was pressed, False on timeout
+        """
+        # Reuse a pending reader so an earlier timed-out wait doesn't swallow the next Enter
+        if self._enter_thread is None or not self._enter_thread.is_alive():
+            self._enter_pressed.clear()
+            self._enter_thread = threading.Thread(target=self._read_enter, daemon=True)
+            self._enter_thread.start()
+        return self._enter_pressed.wait(timeout)
     
     def run(self, method='js', **kwargs):
         """
@@ -552,11 +661,9 @@ class PiCircleAutomation:
         # Allow user to position/click on canvas if needed
         if not self.headless:
             print("\nGame is ready. You have 5 seconds to click on the canvas if needed...")
-            print("(Press Ctrl+C to skip waiting)")
-            try:
-                time.sleep(5)
-            except KeyboardInterrupt:
-                print("\nSkipping wait...")
+            print("(Press Enter to start drawing right away)")
+            if self._wait_for_enter(timeout=5):
+                print("Skipping wait...")
         
         # Draw the circle
         if method == 'js':
@@ -569,13 +676,71 @@ class PiCircleAutomation:
             if not self.headless:
                 print("\nCircle drawing complete! Check the game for your ranking.")
                 print("Press Enter to close the browser...")
-                input()
+                self._wait_for_enter()
         
         return success
     
+    def run_batch(self, configs, method='js'):
+        """
+        Run several drawing configurations in tabs of one browser.
+        
+        All tabs start loading the game at once, so page loads overlap. The draws
+        themselves run one tab at a time, since a WebDriver session can only
+        drive the tab it is switched to.
+        
+        Args:
+            configs: List of dicts of draw parameters (center_x, center_y, radius, ...)
+            method: 'js' for JavaScript drawing, 'mouse' for mouse simulation
+            
+        Returns:
+            List of (config, success, result texts) tuples in the order of configs
+        """
+        if self._driver_thread is not None:
+            self._driver_thread.join()
+            self._driver_thread = None
+        if not self.driver:
+            if not self.setup_driver():
+                return []
+        
+        # Open one tab per config; assigning location returns without waiting for the load
+        original_handle = self.driver.current_window_handle
+        handles = []
+        for _ in configs:
+            self.driver.switch_to.new_window('tab')
+            self.driver.execute_script("window.location.href = arguments[0];", self.game_url)
+            handles.append(self.driver.current_window_handle)
+        
+        draw = self.draw_circle_with_js if method == 'js' else self.draw_circle_with_mouse
+        results = []
+        for config, handle in zip(configs, handles):
+            self.driver.switch_to.window(handle)
+            self._canvas_cache = None
+            print(f"\nRunning {config}")
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "canvas"))
+                )
+                self._inject_helpers()
+                success = draw(**config)
+            except Exception as e:
+                print(f"Error loading game: {e}")
+                success = False
+            results.append((config, success, self.wait_for_result() if success else []))
+            self.driver.close()
+        
+        self.driver.switch_to.window(original_handle)
+        self._canvas_cache = None
+        return results
+    
     def close(self):
         """Close the browser and cleanup."""
+        if self._driver_thread is not None:
+            self._driver_thread.join()
+            self._driver_thread = None
         if self.driver:
+            if self.keep_alive:
+                print("Browser left running for the next run (--keep-alive).")
+                return
             self.driver.quit()
             print("Browser closed.")
 
@@ -594,21 +759,38 @@ def main():
                        help='X coordinate of circle center (default: canvas center)')
     parser.add_argument('--center-y', type=float, default=None,
                        help='Y coordinate of circle center (default: canvas center)')
-    parser.add_argument('--points', type=int, default=200,
-                       help='Number of points for circle (default: 200, more = smoother)')
+    parser.add_argument('--points', type=int, default=120,
+                       help='Number of points for circle (default: 120, more = smoother)')
+    parser.add_argument('--event-points', type=int, default=24,
+                       help='Number of mousemove events dispatched for the js method (default: 24)')
+    parser.add_argument('--radii', type=float, nargs='+', default=None,
+                       help='Try several radii, each in its own tab of one browser')
+    parser.add_argument('--keep-alive', action='store_true',
+                       help='Leave the browser running and reuse it on the next run')
+    parser.add_argument('--fast', action='store_true',
+                       help='Faster page load: eager load strategy, no images or extensions')
     
     args = parser.parse_args()
     
-    automation = PiCircleAutomation(headless=args.headless)
+    automation = PiCircleAutomation(headless=args.headless, keep_alive=args.keep_alive,
+                                    fast=args.fast)
+    
+    draw_kwargs = dict(
+        center_x=args.center_x,
+        center_y=args.center_y,
+        radius=args.radius,
+        num_points=args.points
+    )
+    if args.method == 'js':
+        draw_kwargs['event_points'] = args.event_points
     
     try:
-        automation.run(
-            method=args.method,
-            center_x=args.center_x,
-            center_y=args.center_y,
-            radius=args.radius,
-            num_points=args.points
-        )
+        if args.radii:
+            configs = [dict(draw_kwargs, radius=radius) for radius in args.radii]
+            for config, success, results in automation.run_batch(configs, method=args.method):
+                print(f"radius={config['radius']}: {'; '.join(results) if success else 'failed'}")
+        else:
+            automation.run(method=args.method, **draw_kwargs)
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
     except Exception as e:
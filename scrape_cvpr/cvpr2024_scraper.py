@@ -3,15 +3,47 @@ CVPR 2024 Conference Data Extractor
 Scrapes paper information from https://openaccess.thecvf.com/CVPR2024?day=all
 """
 
+import asyncio
+import gzip
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import csv
-import time
+import html
+import json
 import re
+import threading
+import time
 from urllib.parse import urljoin, urlparse
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
 import logging
 
+# Try to import aiohttp for concurrent abstract fetching (optional)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Try to import httpx with HTTP/2 support so paper pages share one connection (optional)
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Try to import orjson for faster JSONL output (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,62 +51,353 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of paper pages fetched at once when aiohttp is available
+ENRICH_CONCURRENCY = 10
+# Default request budget: average requests per second, and how many may go out in a burst
+REQUESTS_PER_SECOND = 5.0
+REQUEST_BURST = 10
+
+# CSS selectors for the links and abstract container, matched in lexbor's C code
+# instead of testing every href with a regex in Python
+_PDF_LINK = 'a[href$=".pdf"]'
+_SUPP_LINK = 'a[href*="supplemental" i], a[href*="supplementary" i]'
+_ABSTRACT_DIV = 'div[class*="abstract" i]'
+# lexbor parses a selector on every query, so an entry's PDF and supplementary
+# links are fetched with one combined query and told apart by their href
+_ENTRY_LINKS = f'{_PDF_LINK}, {_SUPP_LINK}'
+
+# Start of a <dt> entry in the raw index page
+_DT_TAG_RE = re.compile(rb'<dt[\s>]', re.I)
+# Site root that CVF's relative links resolve against
+_BASE_URL = "https://openaccess.thecvf.com/"
+
+# Highwire citation_* <meta> tags in a paper page's <head>, read without building a DOM
+_META_TAG_RE = re.compile(rb'<meta\s[^>]*>', re.I)
+_META_ATTR_RE = re.compile(rb'(name|content)\s*=\s*"([^"]*)"', re.I)
+# Bounds of the paper list on the index page and the abstract on a paper page,
+# used to slice the raw bytes so the parser skips the surrounding page chrome
+_DL_OPEN_RE = re.compile(rb'<dl[\s>]', re.I)
+_DL_CLOSE = b'</dl>'
+_ABSTRACT_DIV_RE = re.compile(rb'<div\s[^>]*\bid\s*=\s*["\']?abstract(?![\w-])[^>]*>.*?</div\s*>', re.I | re.S)
+# Chunk size for streaming the index page
+INDEX_CHUNK_SIZE = 64 * 1024
+# Index pages with at least this many wanted papers are parsed in a process pool
+PARALLEL_PARSE_MIN_PAPERS = 500
+
+# Fetched pages are cached here (gzipped, keyed by URL hash) so reruns skip the network
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cvpr_scraper")
+CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Retry policy for transient failures, shared by the requests session adapter and
+# the concurrent paper-page fetches
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter.
+    
+    Allows bursts of up to `capacity` requests while keeping the average at `rate`
+    requests per second, so callers only wait when the budget is used up.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        if not rate > 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a request may be sent"""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class Paper:
+    """One paper's metadata (__slots__ keeps thousands of these compact)"""
+    
+    __slots__ = ('title', 'authors', 'abstract', 'pdf_url', 'supplementary_url', 'paper_url')
+    
+    # Fields written to the output files; paper_url is only used to fetch the abstract
+    FIELDS = ('title', 'authors', 'abstract', 'pdf_url', 'supplementary_url')
+    
+    def __init__(self, title: str = '', authors: Optional[List[str]] = None, abstract: str = '',
+                 pdf_url: str = '', supplementary_url: str = '', paper_url: str = ''):
+        self.title = title
+        self.authors = authors if authors is not None else []
+        self.abstract = abstract
+        self.pdf_url = pdf_url
+        self.supplementary_url = supplementary_url
+        self.paper_url = paper_url
+    
+    def to_dict(self) -> Dict:
+        """Return the output fields as a dict"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+    
+    def __repr__(self):
+        return f"Paper(title={self.title!r})"
+
+
+def _parse_chunk(chunk: bytes, max_papers: int) -> List[Paper]:
+    """Parse one slice of the index page in a worker process"""
+    scraper = CVPR2024Scraper(fetch_abstracts=False, max_papers=max_papers)
+    return scraper._extract_papers(LexborHTMLParser(chunk))
+
+
+def _paper_list(content: bytes) -> bytes:
+    """
+    Return the part of the index page from the first <dl> to the last </dl>.
+    
+    A page cut short by fetch_entries has no closing </dl>, so everything after
+    the first <dl> is kept; a page without a <dl> is returned unchanged.
+    """
+    match = _DL_OPEN_RE.search(content)
+    if not match:
+        return content
+    end = content.rfind(_DL_CLOSE, match.start())
+    return content[match.start():end + len(_DL_CLOSE) if end != -1 else len(content)]
+
+
+def _absolute_url(href: str) -> str:
+    """
+    Resolve a CVF link against the site root.
+    
+    Absolute and root-relative hrefs (nearly all of them) are handled with plain
+    string operations; only dot-relative ones such as '../../content/...' on paper
+    pages go through urljoin.
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/') and not href.startswith('//'):
+        return _BASE_URL + href[1:]
+    return urljoin(_BASE_URL, href)
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to back off after failed attempt number `attempt` (0-based), honouring Retry-After"""
+    delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+def _citation_meta(body: bytes) -> Dict[str, List[str]]:
+    """Return the citation_* <meta> values in a page's <head>, keyed by name"""
+    head_end = body.find(b'</head>')
+    meta = {}
+    for tag in _META_TAG_RE.finditer(body, 0, head_end if head_end != -1 else len(body)):
+        attrs = {key.lower(): value for key, value in _META_ATTR_RE.findall(tag.group(0))}
+        name = attrs.get(b'name', b'').decode('utf-8', 'replace')
+        if name.startswith('citation_') and b'content' in attrs:
+            meta.setdefault(name, []).append(html.unescape(attrs[b'content'].decode('utf-8', 'replace')))
+    return meta
+
 
 class CVPR2024Scraper:
     """Scraper for CVPR 2024 conference papers"""
     
-    def __init__(self, base_url: str = "https://openaccess.thecvf.com/CVPR2024?day=all", fetch_abstracts: bool = True, max_papers: int = 100):
+    def __init__(self, base_url: str = "https://openaccess.thecvf.com/CVPR2024?day=all", fetch_abstracts: bool = True, max_papers: int = 100,
+                 cache_dir: Optional[str] = CACHE_DIR, requests_per_second: float = REQUESTS_PER_SECOND):
         self.base_url = base_url
         self.fetch_abstracts = fetch_abstracts
         self.max_papers = max_papers
+        self.cache_dir = cache_dir  # None disables the HTML cache
+        # Be respectful with rate limiting; shared by the sync and async fetch paths
+        self._limiter = TokenBucket(rate=requests_per_second, capacity=REQUEST_BURST)
         self.session = requests.Session()
+        # Keep connections alive across page fetches and retry transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF_FACTOR,
+                              status_forcelist=RETRY_STATUSES,
+                              allowed_methods=frozenset(['GET']))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.papers = []
         
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a webpage"""
+    def _cache_path(self, url: str, partial: bool = False) -> str:
+        """Cache file for a URL; partial entries hold an index page cut short by fetch_entries"""
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, name + ('.partial' if partial else '') + '.html.gz')
+    
+    def _read_cache(self, url: str, partial: bool = False) -> Optional[bytes]:
+        """Return the cached body for a URL, or None if caching is off, missing or expired"""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(url, partial)
+        try:
+            if time.time() - os.path.getmtime(path) > CACHE_TTL:
+                return None
+            with gzip.open(path, 'rb') as f:
+                return f.read()
+        except (OSError, EOFError):
+            return None
+    
+    def _write_cache(self, url: str, content: bytes, partial: bool = False):
+        """Store a fetched body in the cache (fast, low-ratio gzip)"""
+        if not self.cache_dir:
+            return
+        path = self._cache_path(url, partial)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, 'wb', compresslevel=1) as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+    
+    def fetch_html(self, url: str) -> Optional[bytes]:
+        """Fetch a webpage and return its raw body"""
+        cached = self._read_cache(url)
+        if cached is not None:
+            return cached
         try:
+            self._limiter.acquire()
             logger.info(f"Fetching: {url}")
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            self._write_cache(url, response.content)
+            return response.content
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def extract_paper_info(self, paper_element) -> Optional[Dict]:
-        """Extract only: title, authors, pdf_url, supplementary_url"""
+    def _cached_entries(self, url: str, max_entries: int) -> Tuple[Optional[bytes], bool]:
+        """fetch_entries() from the cache: a full page, or a cut one with enough entries"""
+        for partial in (False, True):
+            cached = self._read_cache(url, partial)
+            if cached is None:
+                continue
+            starts = [match.start() for match in _DT_TAG_RE.finditer(cached)]
+            if len(starts) > max_entries:
+                return cached[:starts[max_entries]], True
+            if not partial:
+                return cached, False
+            if len(starts) == max_entries:
+                return cached, True
+        return None, False
+    
+    def fetch_entries(self, url: str, max_entries: int) -> Tuple[Optional[bytes], bool]:
+        """
+        Stream a listing page only up to its (max_entries + 1)-th <dt> entry.
+        
+        Returns the body cut just before that entry (the parser closes any tags
+        left open) and whether it was cut. The rest of the page is never
+        downloaded, so only the entries that can be used are read and parsed.
+        """
+        cached, truncated = self._cached_entries(url, max_entries)
+        if cached is not None:
+            return cached, truncated
         try:
-            paper_info = {}
+            self._limiter.acquire()
+            logger.info(f"Fetching: {url}")
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                body = bytearray()
+                count = 0
+                scan_from = 0
+                for chunk in response.iter_content(chunk_size=INDEX_CHUNK_SIZE):
+                    body += chunk
+                    for match in _DT_TAG_RE.finditer(body, scan_from):
+                        count += 1
+                        if count > max_entries:
+                            content = bytes(body[:match.start()])
+                            self._write_cache(url, content, partial=True)
+                            return content, True
+                        scan_from = match.end()
+                    # Rescan the last few bytes in case a tag straddles two chunks
+                    scan_from = max(scan_from, len(body) - 3)
+                content = bytes(body)
+                self._write_cache(url, content)
+                return content, False
+        except requests.RequestException as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None, False
+    
+    def fetch_page(self, url: str) -> Optional[LexborHTMLParser]:
+        """Fetch and parse a webpage"""
+        content = self.fetch_html(url)
+        return LexborHTMLParser(content) if content is not None else None
+    
+    @staticmethod
+    def _entry_links(nodes) -> Tuple[str, str]:
+        """Return the first PDF and supplementary hrefs under the given nodes ('' if missing)"""
+        pdf_href = supp_href = ''
+        for node in nodes:
+            for link in node.css(_ENTRY_LINKS):
+                href = link.attributes.get('href') or ''
+                if not pdf_href and href.endswith('.pdf'):
+                    pdf_href = href
+                lowered = href.lower()
+                if not supp_href and ('supplemental' in lowered or 'supplementary' in lowered):
+                    supp_href = href
+                if pdf_href and supp_href:
+                    return pdf_href, supp_href
+        return pdf_href, supp_href
+    
+    def extract_paper_info(self, dt_elem: LexborNode, dd_elems: Sequence[LexborNode] = ()) -> Optional[Paper]:
+        """
+        Extract only: title, authors, pdf_url, supplementary_url
+        
+        dd_elems are the <dd> elements following the <dt>: CVF lists the authors
+        in the first one and the PDF/supplementary links in the second.
+        """
+        try:
+            paper_info = Paper()
             
             # Extract title from <dt> element
-            title_elem = paper_element.find('dt')
-            if title_elem:
-                title_link = title_elem.find('a')
-                if title_link:
-                    paper_info['title'] = title_link.get_text(strip=True)
-                    # Store paper URL temporarily for abstract fetching (not saved in final output)
-                    href = title_link.get('href', '')
-                    if href:
-                        paper_info['_paper_url'] = urljoin("https://openaccess.thecvf.com/", href)
-                else:
-                    # Title might be direct text in dt
-                    title_text = title_elem.get_text(strip=True)
-                    if title_text:
-                        paper_info['title'] = title_text
+            title_link = dt_elem.css_first('a')
+            if title_link:
+                paper_info.title = title_link.text(strip=True)
+                # Store paper URL for abstract fetching (not saved in final output)
+                href = title_link.attributes.get('href') or ''
+                if href:
+                    paper_info.paper_url = _absolute_url(href)
+            else:
+                # Title might be direct text in dt
+                title_text = dt_elem.text(strip=True)
+                if title_text:
+                    paper_info.title = title_text
             
-            # Extract authors from <dd> element
-            authors_elem = paper_element.find('dd')
-            if authors_elem:
+            # Extract authors from the first <dd> element
+            if dd_elems:
+                dd_elem = dd_elems[0]
                 # CVF typically has author links
-                author_links = authors_elem.find_all('a')
+                author_links = dd_elem.css('a')
                 if author_links:
-                    paper_info['authors'] = [link.get_text(strip=True) for link in author_links]
+                    paper_info.authors = [link.text(strip=True) for link in author_links]
                 else:
                     # Fallback: extract from text
-                    author_text = authors_elem.get_text(strip=True)
+                    author_text = dd_elem.text(strip=True)
                     # Remove common prefixes
                     for prefix in ['Authors:', 'Author:', 'By:']:
                         if prefix in author_text:
@@ -83,122 +406,255 @@ class CVPR2024Scraper:
                     if author_text:
                         # Split by comma, but be careful with "Last, First" format
                         authors = [a.strip() for a in author_text.split(',')]
-                        paper_info['authors'] = authors
+                        paper_info.authors = authors
             
-            # Extract PDF link (usually in the same dd or dt)
-            pdf_link = paper_element.find('a', href=re.compile(r'\.pdf$'))
-            if pdf_link:
-                href = pdf_link.get('href', '')
-                if href:
-                    paper_info['pdf_url'] = urljoin("https://openaccess.thecvf.com/", href)
+            nodes = [dt_elem, *dd_elems]
             
-            # Extract supplementary material link if available
-            supp_link = paper_element.find('a', href=re.compile(r'supplemental|supplementary', re.I))
-            if supp_link:
-                href = supp_link.get('href', '')
-                if href:
-                    paper_info['supplementary_url'] = urljoin("https://openaccess.thecvf.com/", href)
+            # Extract PDF link (usually in the same dd or dt) and supplementary
+            # material link if available
+            pdf_href, supp_href = self._entry_links(nodes)
+            if pdf_href:
+                paper_info.pdf_url = _absolute_url(pdf_href)
+            if supp_href:
+                paper_info.supplementary_url = _absolute_url(supp_href)
             
-            return paper_info if paper_info.get('title') else None
+            return paper_info if paper_info.title else None
             
         except Exception as e:
             logger.error(f"Error extracting paper info: {e}")
             return None
     
-    def scrape_papers(self) -> List[Dict]:
+    def scrape_papers(self) -> List[Paper]:
         """Scrape all papers from the CVPR 2024 website"""
         logger.info("Starting to scrape CVPR 2024 papers...")
         
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        # Only download and parse the entries that can be used; the whole page is
+        # fetched only if some of them turn out not to be papers
+        content, truncated = self.fetch_entries(self.base_url, self.max_papers)
+        if content is None:
             logger.error("Failed to fetch main page")
             return []
         
+        papers = self._parse_index(content)
+        if len(papers) < self.max_papers and truncated:
+            content = self.fetch_html(self.base_url)
+            if content is not None:
+                papers = self._parse_index(content)
+        
+        # If we found papers, try to get more details from individual paper pages
+        if papers and self.fetch_abstracts:
+            logger.info(f"Found {len(papers)} papers. Fetching abstracts...")
+            papers = self.enrich_paper_details(papers)
+        elif papers:
+            logger.info(f"Found {len(papers)} papers. Skipping abstract fetching (use fetch_abstracts=True to enable).")
+        
+        self.papers = papers
+        return papers
+    
+    def _parse_index(self, content: bytes) -> List[Paper]:
+        """
+        Parse the conference index page into papers.
+        
+        For large max_papers the page is split at <dt> boundaries into one slice
+        per CPU, and the slices are parsed in a process pool.
+        """
+        content = _paper_list(content)
+        starts = [match.start() for match in _DT_TAG_RE.finditer(content)]
+        workers = os.cpu_count() or 1
+        if self.max_papers < PARALLEL_PARSE_MIN_PAPERS or workers < 2 or len(starts) < 2 * workers:
+            return self._extract_papers(LexborHTMLParser(content))
+        
+        # Each slice holds whole <dt>/<dd> entries, wrapped back into a <dl>
+        step = -(-len(starts) // workers)
+        bounds = starts[::step] + [len(content)]
+        chunks = [b'<dl>' + content[begin:end] + b'</dl>' for begin, end in zip(bounds, bounds[1:])]
+        logger.info(f"Parsing {len(starts)} entries in {len(chunks)} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_parse_chunk, chunks, [self.max_papers] * len(chunks))
+            papers = [paper for chunk_papers in results for paper in chunk_papers]
+        return papers[:self.max_papers]
+    
+    def _extract_papers(self, tree: LexborHTMLParser) -> List[Paper]:
+        """Extract up to max_papers papers from the parsed conference index page"""
         papers = []
         
-        # CVF website typically uses <dt> and <dd> pairs for papers
-        # Find all <dt> elements which contain paper titles
-        dt_elements = soup.find_all('dt')
+        # CVF website lists papers in a <dl> as a <dt> title followed by its <dd>
+        # elements; walk each list's children once, grouping the <dd>s under their <dt>
+        entries = []
+        for dl_elem in tree.css('dl'):
+            for child in dl_elem.iter():
+                if child.tag == 'dt':
+                    entries.append((child, []))
+                elif child.tag == 'dd' and entries:
+                    entries[-1][1].append(child)
         
-        logger.info(f"Found {len(dt_elements)} potential paper entries (will stop at {self.max_papers} papers)")
+        logger.info(f"Found {len(entries)} potential paper entries (will stop at {self.max_papers} papers)")
         
-        for idx, dt_elem in enumerate(dt_elements):
+        for idx, (dt_elem, dd_elems) in enumerate(entries):
             # Stop if we've reached the limit
             if len(papers) >= self.max_papers:
                 logger.info(f"Reached limit of {self.max_papers} papers. Stopping extraction.")
                 break
             
-            # Get the corresponding <dd> element (next sibling)
-            dd_elem = dt_elem.find_next_sibling('dd')
-            
-            # Create a wrapper element for extraction
-            wrapper = soup.new_tag('div')
-            wrapper.append(dt_elem)
-            if dd_elem:
-                wrapper.append(dd_elem)
-            
-            paper_info = self.extract_paper_info(wrapper)
+            paper_info = self.extract_paper_info(dt_elem, dd_elems)
             if paper_info:
                 papers.append(paper_info)
-                logger.info(f"Extracted paper {len(papers)}/{self.max_papers}: {paper_info.get('title', 'Unknown')[:60]}...")
+                logger.info(f"Extracted paper {len(papers)}/{self.max_papers}: {paper_info.title[:60]}...")
             
-            # Be respectful with rate limiting
             if (idx + 1) % 20 == 0:
-                time.sleep(0.3)
-                logger.info(f"Progress: {idx + 1}/{len(dt_elements)} entries processed, {len(papers)} papers extracted")
-        
-        # If we found papers, try to get more details from individual paper pages
-        if papers and self.fetch_abstracts:
-            logger.info(f"Found {len(papers)} papers. Fetching abstracts...")
-            papers = self.enrich_paper_details(papers)
-        elif papers:
-            logger.info(f"Found {len(papers)} papers. Skipping abstract fetching (use fetch_abstracts=True to enable).")
+                logger.info(f"Progress: {idx + 1}/{len(entries)} entries processed, {len(papers)} papers extracted")
         
-        self.papers = papers
         return papers
     
-    def enrich_paper_details(self, papers: List[Dict]) -> List[Dict]:
+    @staticmethod
+    def _paper_page_url(paper: Paper) -> Optional[str]:
+        """Return the paper page URL from the title link (stored as paper_url) or the PDF URL"""
+        paper_url = paper.paper_url
+        if not paper_url and paper.pdf_url:
+            # Convert PDF URL to paper page URL
+            paper_url = paper.pdf_url.replace('/papers/', '/').replace('.pdf', '.html')
+        return paper_url
+    
+    def _apply_paper_page(self, paper: Paper, body: bytes):
+        """
+        Fill in the abstract (and PDF link and authors if missing) from a paper page.
+        
+        The citation_* <meta> tags in the <head> are read first, then just the
+        <div id="abstract"> slice of the page; the full page is only parsed for
+        whatever is still missing.
+        """
+        meta = _citation_meta(body)
+        
+        if meta.get('citation_abstract'):
+            paper.abstract = meta['citation_abstract'][0].strip()
+        if not paper.pdf_url and meta.get('citation_pdf_url'):
+            paper.pdf_url = _absolute_url(meta['citation_pdf_url'][0])
+        if not paper.authors and meta.get('citation_author'):
+            # Highwire lists authors as "Last, First"
+            paper.authors = [' '.join(reversed(author.split(', ', 1))) for author in meta['citation_author']]
+        
+        if not paper.abstract:
+            match = _ABSTRACT_DIV_RE.search(body)
+            if match:
+                paper.abstract = LexborHTMLParser(match.group(0)).css_first('div').text(strip=True)
+        
+        if paper.abstract and paper.pdf_url:
+            return
+        
+        tree = LexborHTMLParser(body)
+        
+        # Fall back to any abstract-like container
+        if not paper.abstract:
+            abstract_elem = tree.css_first(_ABSTRACT_DIV)
+            if abstract_elem:
+                paper.abstract = abstract_elem.text(strip=True)
+        
+        # Extract PDF link if not already found
+        if not paper.pdf_url:
+            pdf_link = tree.css_first(_PDF_LINK)
+            if pdf_link:
+                href = pdf_link.attributes.get('href') or ''
+                if href:
+                    paper.pdf_url = _absolute_url(href)
+    
+    def enrich_paper_details(self, papers: List[Paper]) -> List[Paper]:
         """Enrich paper information by visiting individual paper pages - only extract abstracts"""
+        # Fetch pages concurrently when httpx (HTTP/2) or aiohttp is installed
+        if HTTP2_AVAILABLE or AIOHTTP_AVAILABLE:
+            return asyncio.run(self.enrich_paper_details_async(papers))
+        
         enriched_papers = []
         
         for idx, paper in enumerate(papers):
-            # Try to find paper URL from title link (stored as _paper_url) or construct from PDF
-            paper_url = paper.get('_paper_url')
-            if not paper_url and 'pdf_url' in paper and paper['pdf_url']:
-                # Convert PDF URL to paper page URL
-                paper_url = paper['pdf_url'].replace('/papers/', '/').replace('.pdf', '.html')
-            
+            paper_url = self._paper_page_url(paper)
             if paper_url:
-                soup = self.fetch_page(paper_url)
-                if soup:
-                    # Try to extract abstract
-                    abstract_elem = soup.find('div', id='abstract')
-                    if not abstract_elem:
-                        abstract_elem = soup.find('div', class_=re.compile(r'abstract', re.I))
-                    if abstract_elem:
-                        paper['abstract'] = abstract_elem.get_text(strip=True)
-                    
-                    # Extract PDF link if not already found
-                    if 'pdf_url' not in paper or not paper['pdf_url']:
-                        pdf_link = soup.find('a', href=re.compile(r'\.pdf$'))
-                        if pdf_link:
-                            href = pdf_link.get('href', '')
-                            if href:
-                                paper['pdf_url'] = urljoin("https://openaccess.thecvf.com/", href)
-            
-            # Remove temporary _paper_url field
-            if '_paper_url' in paper:
-                del paper['_paper_url']
+                body = self.fetch_html(paper_url)
+                if body is not None:
+                    self._apply_paper_page(paper, body)
             
             enriched_papers.append(paper)
             
-            # Rate limiting
             if (idx + 1) % 5 == 0:
-                time.sleep(1)
                 logger.info(f"Enriched {idx + 1}/{len(papers)} papers...")
         
         return enriched_papers
     
+    async def enrich_paper_details_async(self, papers: List[Paper]) -> List[Paper]:
+        """Same as enrich_paper_details, fetching up to ENRICH_CONCURRENCY pages at once.
+        
+        Uses a single multiplexed HTTP/2 connection via httpx when available,
+        otherwise a pool of HTTP/1.1 keep-alive connections via aiohttp.
+        """
+        semaphore = asyncio.Semaphore(ENRICH_CONCURRENCY)
+        headers = dict(self.session.headers)
+        done = 0
+        
+        if HTTP2_AVAILABLE:
+            client = httpx.AsyncClient(
+                http2=True, headers=headers, timeout=30, follow_redirects=True,
+                limits=httpx.Limits(max_connections=ENRICH_CONCURRENCY,
+                                    max_keepalive_connections=ENRICH_CONCURRENCY)
+            )
+            errors = (httpx.HTTPError,)
+            
+            async def get(url: str) -> Tuple[int, Optional[str], bytes]:
+                response = await client.get(url)
+                return response.status_code, response.headers.get('Retry-After'), response.content
+        else:
+            client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=ENRICH_CONCURRENCY, limit_per_host=ENRICH_CONCURRENCY,
+                                               keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30), headers=headers
+            )
+            errors = (aiohttp.ClientError, asyncio.TimeoutError)
+            
+            async def get(url: str) -> Tuple[int, Optional[str], bytes]:
+                async with client.get(url) as response:
+                    return response.status, response.headers.get('Retry-After'), await response.read()
+        
+        async def fetch(url: str) -> Optional[bytes]:
+            """GET a page, retrying like the session's Retry adapter; None if it keeps failing"""
+            for attempt in range(RETRY_TOTAL + 1):
+                await self._limiter.acquire_async()
+                logger.info(f"Fetching: {url}")
+                retry_after = None
+                try:
+                    status, retry_after, body = await get(url)
+                except errors as e:
+                    problem = str(e) or type(e).__name__
+                else:
+                    if status < 400:
+                        return body
+                    problem = f"HTTP {status}"
+                    if status not in RETRY_STATUSES:
+                        break
+                if attempt < RETRY_TOTAL:
+                    await asyncio.sleep(_retry_delay(attempt, retry_after))
+            logger.error(f"Error fetching {url}: {problem}")
+            return None
+        
+        async def enrich(paper):
+            nonlocal done
+            paper_url = self._paper_page_url(paper)
+            if paper_url:
+                body = self._read_cache(paper_url)
+                if body is None:
+                    async with semaphore:
+                        body = await fetch(paper_url)
+                    if body is not None:
+                        self._write_cache(paper_url, body)
+                if body is not None:
+                    self._apply_paper_page(paper, body)
+            
+            done += 1
+            if done % 5 == 0:
+                logger.info(f"Enriched {done}/{len(papers)} papers...")
+            return paper
+        
+        async with client:
+            return list(await asyncio.gather(*(enrich(paper) for paper in papers)))
+    
     def save_to_csv(self, filename: str = 'cvpr2024_papers.csv'):
         """Save papers to CSV file - only required fields"""
         if not self.papers:
@@ -206,21 +662,34 @@ class CVPR2024Scraper:
             return
         
         # Only include required fields
-        fieldnames = ['title', 'authors', 'abstract', 'pdf_url', 'supplementary_url']
+        fieldnames = Paper.FIELDS
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for paper in self.papers:
-                row = {
-                    'title': paper.get('title', ''),
-                    'authors': '; '.join(paper.get('authors', [])) if isinstance(paper.get('authors'), list) else paper.get('authors', ''),
-                    'abstract': paper.get('abstract', ''),
-                    'pdf_url': paper.get('pdf_url', ''),
-                    'supplementary_url': paper.get('supplementary_url', '')
-                }
-                writer.writerow(row)
+        # Build plain rows up front and hand them to writerows in one call
+        rows = [
+            [paper.title, '; '.join(paper.authors), paper.abstract, paper.pdf_url, paper.supplementary_url]
+            for paper in self.papers
+        ]
+        
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+        
+        logger.info(f"Saved {len(self.papers)} papers to {filename}")
+    
+    def save_to_jsonl(self, filename: str = 'cvpr2024_papers.jsonl'):
+        """Save papers to a JSON Lines file, one paper object per line with authors as a list"""
+        if not self.papers:
+            logger.warning("No papers to save")
+            return
+        
+        records = [paper.to_dict() for paper in self.papers]
+        
+        with open(filename, 'wb') as f:
+            if ORJSON_AVAILABLE:
+                f.writelines(orjson.dumps(record) + b'\n' for record in records)
+            else:
+                f.writelines((json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8') for record in records)
         
         logger.info(f"Saved {len(self.papers)} papers to {filename}")
     
@@ -232,25 +701,25 @@ class CVPR2024Scraper:
             f.write(f"Total Papers Extracted: {len(self.papers)}\n\n")
             
             # Count papers with abstracts
-            papers_with_abstracts = sum(1 for p in self.papers if p.get('abstract'))
+            papers_with_abstracts = sum(1 for p in self.papers if p.abstract)
             f.write(f"Papers with Abstracts: {papers_with_abstracts}\n")
             
             # Count papers with PDFs
-            papers_with_pdfs = sum(1 for p in self.papers if p.get('pdf_url'))
+            papers_with_pdfs = sum(1 for p in self.papers if p.pdf_url)
             f.write(f"Papers with PDF Links: {papers_with_pdfs}\n\n")
             
             f.write("Sample Papers:\n")
             f.write("-" * 50 + "\n")
             for i, paper in enumerate(self.papers[:10], 1):
-                f.write(f"\n{i}. {paper.get('title', 'Unknown Title')}\n")
-                if paper.get('authors'):
-                    authors = paper['authors'] if isinstance(paper['authors'], list) else [paper['authors']]
+                f.write(f"\n{i}. {paper.title or 'Unknown Title'}\n")
+                if paper.authors:
+                    authors = paper.authors
                     f.write(f"   Authors: {', '.join(authors[:3])}")
                     if len(authors) > 3:
                         f.write(f" et al. ({len(authors)} total)")
                     f.write("\n")
-                if paper.get('abstract'):
-                    abstract = paper['abstract'][:200] + "..." if len(paper['abstract']) > 200 else paper['abstract']
+                if paper.abstract:
+                    abstract = paper.abstract[:200] + "..." if len(paper.abstract) > 200 else paper.abstract
                     f.write(f"   Abstract: {abstract}\n")
         
         logger.info(f"Saved summary to {filename}")
@@ -267,9 +736,19 @@ def main():
                        help='URL to scrape (default: CVPR 2024)')
     parser.add_argument('--max-papers', type=int, default=100,
                        help='Maximum number of papers to extract (default: 100)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Always download pages instead of reusing ones cached in {CACHE_DIR} (kept for 24 hours)')
+    parser.add_argument('--requests-per-second', type=float, default=REQUESTS_PER_SECOND,
+                       help=f'Average request rate limit (default: {REQUESTS_PER_SECOND:g}, bursts of up to {REQUEST_BURST})')
+    parser.add_argument('--jsonl', action='store_true',
+                       help='Also save the papers as JSON Lines (cvpr2024_papers.jsonl)')
     args = parser.parse_args()
+    if not args.requests_per_second > 0:
+        parser.error("--requests-per-second must be greater than 0")
     
-    scraper = CVPR2024Scraper(base_url=args.url, fetch_abstracts=not args.no_abstracts, max_papers=args.max_papers)
+    scraper = CVPR2024Scraper(base_url=args.url, fetch_abstracts=not args.no_abstracts, max_papers=args.max_papers,
+                              cache_dir=None if args.no_cache else CACHE_DIR,
+                              requests_per_second=args.requests_per_second)
     
     # Scrape papers
     papers = scraper.scrape_papers()
@@ -278,11 +757,15 @@ def main():
         # Save in CSV and summary formats
         scraper.save_to_csv()
         scraper.save_summary()
+        if args.jsonl:
+            scraper.save_to_jsonl()
         
         print(f"\n✓ Successfully extracted {len(papers)} papers from CVPR 2024 (limited to {scraper.max_papers})")
         print("✓ Files created:")
         print("  - cvpr2024_papers.csv (CSV format)")
         print("  - cvpr2024_summary.txt (Summary report)")
+        if args.jsonl:
+            print("  - cvpr2024_papers.jsonl (JSON Lines format)")
     else:
         print("✗ No papers were extracted. The website structure may have changed.")
         print("  Please check the website manually or update the scraper.")
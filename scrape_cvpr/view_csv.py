@@ -5,6 +5,7 @@ Displays CSV files in a formatted table in the terminal
 
 import csv
 import sys
+from itertools import zip_longest
 from typing import List
 
 def print_table(data: List[List[str]], headers: List[str], max_width: int = 80):
@@ -13,18 +14,13 @@ def print_table(data: List[List[str]], headers: List[str], max_width: int = 80):
         print("No data to display")
         return
     
-    # Calculate column widths
+    # Convert cells to strings once, padding short rows
     num_cols = len(headers)
-    col_widths = [len(str(header)) for header in headers]
+    rows = [[str(cell) for cell in row[:num_cols]] + [''] * (num_cols - len(row)) for row in data]
     
-    for row in data:
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
-    
-    # Limit column width to max_width
-    for i in range(len(col_widths)):
-        col_widths[i] = min(col_widths[i], max_width)
+    # Calculate column widths in one pass over the transposed rows, limited to max_width
+    col_widths = [min(max_width, max(len(str(header)), max(map(len, column), default=0)))
+                  for header, column in zip(headers, zip_longest(*rows, fillvalue=''))]
     
     # Print header
     header_row = " | ".join(str(headers[i])[:col_widths[i]].ljust(col_widths[i]) 
@@ -33,16 +29,11 @@ def print_table(data: List[List[str]], headers: List[str], max_width: int = 80):
     print(header_row)
     print("=" * len(header_row))
     
-    # Print rows
-    for row in data:
-        display_row = []
-        for i, cell in enumerate(row):
-            if i < num_cols:
-                cell_str = str(cell)
-                if len(cell_str) > col_widths[i]:
-                    cell_str = cell_str[:col_widths[i]-3] + "..."
-                display_row.append(cell_str.ljust(col_widths[i]))
-        print(" | ".join(display_row))
+    # Print rows, truncating long cells, with one format string built up front
+    row_format = " | ".join(f"{{:<{width}}}" for width in col_widths)
+    for row in rows:
+        print(row_format.format(*(cell if len(cell) <= width else cell[:width-3] + "..."
+                                  for cell, width in zip(row, col_widths))))
     
     print("=" * len(header_row))
     print(f"\nTotal rows: {len(data)}")